@@ -43,9 +43,10 @@ Date: 2025-11-13
 import sys
 from pathlib import Path
 
-# Add src to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# Add src to Python path (once; re-running in the same interpreter is a no-op)
+src_path = str(Path(__file__).parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Import and run new UI
 from legion.ui.app import main
@@ -19,9 +19,18 @@ if TYPE_CHECKING:
         import tomli as tomllib  # type: ignore
 
 import tomli_w  # For writing TOML
+
+# Optional: rtoml (Rust) encodes/decodes TOML much faster than tomllib/tomli_w
+try:
+    import rtoml
+    RTOML_AVAILABLE = True
+except ImportError:
+    RTOML_AVAILABLE = False
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any
 import logging
+import pickle
 from dataclasses import asdict
 
 from legion.config.schema import (
@@ -37,6 +46,39 @@ from legion.platform.paths import get_config_dir
 
 logger = logging.getLogger(__name__)
 
+_TOML_DECODE_ERRORS: tuple[type[Exception], ...] = (tomllib.TOMLDecodeError,)
+if RTOML_AVAILABLE:
+    _TOML_DECODE_ERRORS += (rtoml.TomlParsingError,)
+
+
+def _read_toml(path: Path) -> dict[str, Any]:
+    """Parse a TOML file, using rtoml when available."""
+    if RTOML_AVAILABLE:
+        return rtoml.load(path)
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+@lru_cache(maxsize=4)
+def _read_toml_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Parse a TOML file once per file version (mtime_ns and size are cache keys only).
+    
+    The parsed dict is returned pickled so every caller unpickles its own
+    copy and configs built from it never share mutable state.
+    """
+    return pickle.dumps(_read_toml(Path(path)), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _write_toml(data: dict[str, Any], path: Path) -> None:
+    """Write a dict as TOML, using rtoml when available."""
+    if RTOML_AVAILABLE:
+        with open(path, "w", encoding="utf-8") as f:
+            rtoml.dump(data, f, pretty=True)
+        return
+    with open(path, "wb") as f:
+        tomli_w.dump(data, f)
+
 
 class ConfigManager:
     """Manages Legion configuration files."""
@@ -74,8 +116,11 @@ class ConfigManager:
             return self._config
         
         try:
-            with open(self.config_path, "rb") as f:
-                data = tomllib.load(f)
+            # Re-parse only when the file changed since the last load
+            st = self.config_path.stat()
+            data = pickle.loads(
+                _read_toml_cached(str(self.config_path), st.st_mtime_ns, st.st_size)
+            )
             
             logger.info(f"Loaded config from: {self.config_path}")
             self._config = self._dict_to_config(data)
@@ -87,7 +132,7 @@ class ConfigManager:
             
             return self._config
             
-        except tomllib.TOMLDecodeError as e:
+        except _TOML_DECODE_ERRORS as e:
             logger.error(f"Invalid TOML in config file: {e}")
             raise ValueError(f"Failed to parse config file: {e}") from e
         except Exception as e:
@@ -143,8 +188,7 @@ class ConfigManager:
         
         # Write TOML
         try:
-            with open(self.config_path, "wb") as f:
-                tomli_w.dump(data, f)
+            _write_toml(data, self.config_path)
             logger.info(f"Saved config to: {self.config_path}")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
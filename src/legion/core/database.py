@@ -8,7 +8,7 @@ storing data as JSON files. Can be replaced with SQLAlchemy later.
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 try:
     from legion.core.models import Host, Port, Service, Credential
@@ -124,6 +124,22 @@ class SimpleDatabase:
         Args:
             host: Host object to save.
         """
+        self._put_host(host)
+        self._save()
+    
+    def save_hosts(self, hosts: Iterable[Host]) -> None:
+        """
+        Save or update several hosts, writing the JSON files once.
+        
+        Args:
+            hosts: Host objects to save.
+        """
+        for host in hosts:
+            self._put_host(host)
+        self._save()
+    
+    def _put_host(self, host: Host) -> None:
+        """Store a host in memory without persisting."""
         host_dict = {
             "ip": host.ip,
             "hostname": host.hostname,
@@ -145,7 +161,6 @@ class SimpleDatabase:
         }
         
         self._hosts[host.ip] = host_dict
-        self._save()
     
     def save_port(self, host_ip: str, port: Port) -> None:
         """
@@ -155,6 +170,22 @@ class SimpleDatabase:
             host_ip: IP address of the host.
             port: Port object to save.
         """
+        self._put_port(host_ip, port)
+        self._save()
+    
+    def save_ports_bulk(self, pairs: Iterable[tuple[str, Port]]) -> None:
+        """
+        Save or update several ports, writing the JSON files once.
+        
+        Args:
+            pairs: (host_ip, port) tuples, applied in order.
+        """
+        for host_ip, port in pairs:
+            self._put_port(host_ip, port)
+        self._save()
+    
+    def _put_port(self, host_ip: str, port: Port) -> None:
+        """Store a port in memory without persisting."""
         # Check if port exists and track state changes
         port_key = f"{port.number}/{port.protocol}"
         if host_ip in self._ports:
@@ -200,8 +231,6 @@ class SimpleDatabase:
             self._ports[host_ip][existing_idx] = port_dict
         else:
             self._ports[host_ip].append(port_dict)
-        
-        self._save()
     
     def get_host(self, ip: str) -> Optional[Host]:
         """
@@ -343,6 +372,20 @@ class SimpleDatabase:
         all_ports = self.get_ports(host_ip)
         return [p for p in all_ports if p.is_open]
     
+    def get_open_port_counts(self) -> dict[str, int]:
+        """
+        Get the number of open ports for every host in one pass.
+        
+        Works on the raw port dicts, so no Port objects are built.
+        
+        Returns:
+            Dictionary mapping host IP to open port count.
+        """
+        return {
+            host_ip: sum(1 for p in ports if p.get("state") == "open")
+            for host_ip, ports in self._ports.items()
+        }
+    
     def get_up_hosts(self) -> list[Host]:
         """
         Get all hosts that are up.
@@ -395,9 +438,9 @@ class SimpleDatabase:
     
     def clear(self) -> None:
         """Clear all data from database."""
-        self._hosts.clear()
-        self._ports.clear()
-        self._services.clear()
+        # Rebind rather than clear() in place: the old dicts are dropped
+        # in one go instead of being emptied entry by entry
+        self._hosts, self._ports, self._services = {}, {}, {}
         self._save()
     
     def __str__(self) -> str:
@@ -522,8 +565,7 @@ if __name__ == "__main__":
     ]
     
     print("Saving ports...")
-    for port in ports:
-        db.save_port(host.ip, port)
+    db.save_ports_bulk((host.ip, port) for port in ports)
     
     # Retrieve and display
     print("\n" + "=" * 60)
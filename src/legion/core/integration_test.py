@@ -186,8 +186,8 @@ async def main():
             print(f"  Found {len(result.hosts)} host(s)")
             
             # Store in database
+            port_pairs = []
             for host in result.hosts:
-                db.save_host(host)
                 total_hosts += 1
                 
                 # Get ports for this host from result
@@ -195,9 +195,11 @@ async def main():
                 port_count = len(ports)
                 print(f"  Stored host: {host.ip} with {port_count} port(s)")
                 
-                for port in ports:
-                    db.save_port(host.ip, port)
-                    total_ports += 1
+                port_pairs.extend((host.ip, port) for port in ports)
+                total_ports += port_count
+            
+            db.save_hosts(result.hosts)
+            db.save_ports_bulk(port_pairs)
                     
         except Exception as e:
             print(f"  ERROR: {e}")
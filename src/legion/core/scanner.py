@@ -53,6 +53,7 @@ class ScanJob:
     result_file: Optional[Path] = None
     hosts_found: int = 0
     ports_found: int = 0
+    host_ips: List[str] = field(default_factory=list)  # Hosts stored by this job
     
     @property
     def duration(self) -> Optional[float]:
@@ -203,16 +204,17 @@ class ScanManager:
             # Parse XML
             result = self._parser.parse_file(xml_path)
             
-            # Store hosts and ports
-            for host in result.hosts:
-                self.database.save_host(host)
-                job.hosts_found += 1
-                
-                # Get ports for this host from the ports dict
-                host_ports = result.ports.get(host.ip, [])
-                for port in host_ports:
-                    self.database.save_port(host.ip, port)
-                    job.ports_found += 1
+            # Store hosts and ports, persisting once per batch
+            port_pairs = [
+                (host.ip, port)
+                for host in result.hosts
+                for port in result.ports.get(host.ip, [])
+            ]
+            self.database.save_hosts(result.hosts)
+            self.database.save_ports_bulk(port_pairs)
+            job.hosts_found += len(result.hosts)
+            job.host_ips.extend(host.ip for host in result.hosts)
+            job.ports_found += len(port_pairs)
             
             job.result_file = xml_path
             
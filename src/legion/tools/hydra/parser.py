@@ -13,10 +13,11 @@ Date: 2025-11-13
 
 import re
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class HydraCredential:
     """A single discovered credential."""
     
@@ -40,7 +41,7 @@ class HydraCredential:
         return f"{self.login}:{self.password} @ {self.service}://{self.host}:{self.port}"
 
 
-@dataclass
+@dataclass(slots=True)
 class HydraStatistics:
     """Attack statistics from Hydra run."""
     
@@ -68,7 +69,7 @@ class HydraStatistics:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HydraResult:
     """Complete Hydra attack result."""
     
@@ -153,8 +154,12 @@ class HydraOutputParser:
     """
     
     # Regex patterns for parsing
+    # Whitespace is matched as [^\S\n] so a credential never spans lines
+    # and the pattern can be run over the whole output with finditer()
     CREDENTIAL_PATTERN = re.compile(
-        r'\[(\d+)\]\[([^\]]+)\]\s+host:\s*(\S+)\s+login:\s*(\S+)\s+password:\s*(.+?)(?:\s*$|\s+\[)'
+        r'\[(\d+)\]\[([^\]\n]+)\][^\S\n]+host:[^\S\n]*(\S+)[^\S\n]+login:[^\S\n]*(\S+)'
+        r'[^\S\n]+password:[^\S\n]*(.+?)(?:[^\S\n]*$|[^\S\n]+\[)',
+        re.MULTILINE
     )
     
     STATISTICS_PATTERN = re.compile(
@@ -202,45 +207,40 @@ class HydraOutputParser:
         """
         result = HydraResult(raw_output=output)
         
-        lines = output.splitlines()
-        
-        # Parse credentials
-        for line in lines:
-            cred = self._parse_credential(line)
-            if cred:
-                result.credentials.append(cred)
-                # Extract target/service from first credential
-                if not result.target:
-                    result.target = cred.host
-                if not result.service:
-                    result.service = cred.service
+        # Parse credentials in a single scan over the whole output
+        result.credentials = [
+            self._credential_from_match(match)
+            for match in self.CREDENTIAL_PATTERN.finditer(output)
+        ]
+        # Extract target/service from first credential
+        if result.credentials:
+            result.target = result.credentials[0].host
+            result.service = result.credentials[0].service
         
         # Parse statistics
         result.statistics = self._parse_statistics(output)
         result.statistics.successful_attempts = len(result.credentials)
         
-        # Parse errors and warnings
-        for line in lines:
-            error = self._parse_error(line)
+        # Parse errors and warnings ('.' stops at newlines, so each match
+        # is the rest of its line, as with a per-line search)
+        for match in self.ERROR_PATTERN.finditer(output):
+            error = match.group(1).strip()
             if error:
                 result.errors.append(error)
-            
-            warning = self._parse_warning(line)
+        
+        for match in self.WARNING_PATTERN.finditer(output):
+            warning = match.group(1).strip()
             if warning:
                 result.warnings.append(warning)
         
         return result
     
-    def _parse_credential(self, line: str) -> Optional[HydraCredential]:
+    def _credential_from_match(self, match: re.Match) -> HydraCredential:
         """
-        Parse a single credential line.
+        Build a credential from a CREDENTIAL_PATTERN match.
         
         Format: [22][ssh] host: 192.168.1.1   login: admin   password: password123
         """
-        match = self.CREDENTIAL_PATTERN.search(line)
-        if not match:
-            return None
-        
         port_str, service, host, login, password = match.groups()
         
         return HydraCredential(
@@ -273,7 +273,6 @@ class HydraOutputParser:
         finished_match = self.DURATION_PATTERN.search(output)
         
         if started_match and finished_match:
-            from datetime import datetime
             try:
                 started = datetime.strptime(started_match.group(1), "%Y-%m-%d %H:%M:%S")
                 finished = datetime.strptime(finished_match.group(1), "%Y-%m-%d %H:%M:%S")
@@ -294,20 +293,6 @@ class HydraOutputParser:
             stats.successful_attempts = found_passwords
         
         return stats
-    
-    def _parse_error(self, line: str) -> Optional[str]:
-        """Parse error message from line."""
-        match = self.ERROR_PATTERN.search(line)
-        if match:
-            return match.group(1).strip()
-        return None
-    
-    def _parse_warning(self, line: str) -> Optional[str]:
-        """Parse warning message from line."""
-        match = self.WARNING_PATTERN.search(line)
-        if match:
-            return match.group(1).strip()
-        return None
 
 
 if __name__ == "__main__":
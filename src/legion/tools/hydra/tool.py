@@ -55,6 +55,10 @@ class HydraTool(BaseTool):
                 tool_path = discovered_path
         
         super().__init__(tool_path=tool_path)
+        
+        # Cached `hydra -h` result as (tool_path, result); validate() and
+        # get_version() both need it, so only one subprocess is spawned
+        self._help_cache: Optional[tuple[Path, ToolResult]] = None
 
     @property
     def tool_name(self) -> str:
@@ -78,7 +82,7 @@ class HydraTool(BaseTool):
         
         try:
             # Hydra uses -h, not --version
-            result = await self.run(["-h"], timeout=5.0)
+            result = await self._run_help()
             # Hydra -h returns exit code 255, but outputs help
             return "Hydra" in result.stdout or result.success
         except Exception:
@@ -95,7 +99,7 @@ class HydraTool(BaseTool):
             Version string (e.g., "9.1") or "unknown".
         """
         try:
-            result = await self.run(["-h"], timeout=5.0)
+            result = await self._run_help()
             if "Hydra" in result.stdout:
                 # Use existing _extract_version() method
                 first_line = result.stdout.split('\n')[0]
@@ -104,6 +108,21 @@ class HydraTool(BaseTool):
             pass
         
         return "unknown"
+    
+    async def _run_help(self) -> ToolResult:
+        """
+        Run `hydra -h`, reusing the result for the current tool path.
+        
+        Only output that identifies Hydra is cached, so a failed run is
+        retried on the next call.
+        """
+        if self._help_cache and self._help_cache[0] == self._tool_path:
+            return self._help_cache[1]
+        
+        result = await self.run(["-h"], timeout=5.0)
+        if "Hydra" in result.stdout:
+            self._help_cache = (self._tool_path, result)
+        return result
 
     async def attack(
         self,
@@ -167,7 +167,11 @@ def main(config_path: Optional[Path] = None) -> int:
     Returns:
         Exit code
     """
-    # Setup logging
+    # Setup logging. The format uses no thread/process fields, so don't
+    # collect them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
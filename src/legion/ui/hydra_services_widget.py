@@ -138,13 +138,13 @@ class HydraServicesWidget(QWidget):
         """
         # Only add open ports
         if state != "open":
-            logger.debug(f"Skipping non-open port {host}:{port} ({state})")
+            logger.debug("Skipping non-open port %s:%s (%s)", host, port, state)
             return
         
         # Check if already exists
         key = (host, port, service)
         if key in self.services:
-            logger.debug(f"Service {host}:{port} ({service}) already in list")
+            logger.debug("Service %s:%s (%s) already in list", host, port, service)
             return
         
         # Add to storage
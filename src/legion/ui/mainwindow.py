@@ -18,13 +18,12 @@ from PyQt6 import QtWidgets, QtGui, QtCore
 from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal, QObject
 from PyQt6.QtWidgets import QMainWindow, QMessageBox, QTableView
 
-from legion.config import get_config, ConfigManager
+from legion.config import get_config, ConfigManager, LegionConfig
 from legion.core.database import SimpleDatabase
 from legion.core.scanner import ScanManager, ScanJob
 from legion.core.models import Credential
 from legion.ui.models import HostsTableModel, PortsTableModel
 from legion.ui.dialogs import NewScanDialog, ScanProgressDialog, AboutDialog, AddHostDialog
-from legion.ui.settings import SettingsDialog
 from legion.ui.brute_widget import BruteWidget
 from legion.ui.hydra_services_widget import HydraServicesWidget
 from legion.ui.hydra_history_widget import HydraHistoryWidget, AttackRecord
@@ -410,7 +409,8 @@ class MainWindow(QMainWindow):
                     
                     if analysis.mode == AttackMode.COMBO:
                         combo_file = WordlistStrategy.prepare_combo_file(
-                            analysis.combo_files, temp_dir, max_entries=10000
+                            analysis.combo_files, temp_dir, max_entries=10000,
+                            analysis=analysis
                         )
                         brute_widget.append_output(f"✅ Prepared combo file: {combo_file.name}")
                         username_file = None
@@ -420,7 +420,8 @@ class MainWindow(QMainWindow):
                             analysis.username_files,
                             analysis.password_files,
                             temp_dir,
-                            max_entries=1000
+                            max_entries=1000,
+                            analysis=analysis
                         )
                         brute_widget.append_output(
                             f"✅ Prepared wordlists:\n"
@@ -1244,7 +1245,7 @@ class MainWindow(QMainWindow):
         if self.config.ui.remember_window_size:
             self.setWindowState(Qt.WindowState.WindowMaximized)
         
-        logger.debug(f"Config applied: theme={self.config.ui.theme}, font={self.config.ui.font_size}pt")
+        logger.debug("Config applied: theme=%s, font=%spt", self.config.ui.theme, self.config.ui.font_size)
     
     def _apply_theme(self, theme: str) -> None:
         """
@@ -1297,7 +1298,7 @@ class MainWindow(QMainWindow):
                 # Update ports table for selected host
                 self.ports_model.set_host(host.ip)
                 self.ports_table.resizeColumnsToContents()
-                logger.debug(f"Selected host: {host.ip}")
+                logger.debug("Selected host: %s", host.ip)
                 
                 # Update scan button states
                 self._update_scan_buttons()
@@ -1329,16 +1330,35 @@ class MainWindow(QMainWindow):
         
         # Restore selection if possible
         if current_host_ip:
-            for row in range(self.hosts_model.rowCount()):
-                host = self.hosts_model.get_host(row)
-                if host and host.ip == current_host_ip:
-                    self.hosts_table.selectRow(row)
-                    break
+            row = self.hosts_model.row_for_ip(current_host_ip)
+            if row is not None:
+                self.hosts_table.selectRow(row)
         
         # Resize columns
         self.hosts_table.resizeColumnsToContents()
         self.status_label.setText(f"Refreshed - {self.hosts_model.rowCount()} hosts")
     
+    def _update_host_rows(self, host_ips: list[str]) -> None:
+        """
+        Show changes to hosts already saved in the database.
+        
+        Rows already in the hosts table are repainted in place, keeping the
+        selection; any new host falls back to a full refresh_data().
+        
+        Args:
+            host_ips: IP addresses of the changed hosts
+        """
+        if any(self.hosts_model.row_for_ip(ip) is None for ip in host_ips):
+            self.refresh_data()
+            return
+        
+        self.hosts_model.update_hosts(host_ips)
+        
+        # No reset means no reselection, so reload the selected host's ports
+        current_host_ip = self.ports_model._current_host
+        if current_host_ip in host_ips:
+            self.ports_model.set_host(current_host_ip)
+    
     # ========================================
     # Scanner Callbacks (called from scanner thread)
     # ========================================
@@ -1360,7 +1380,7 @@ class MainWindow(QMainWindow):
         Args:
             job: Completed scan job
         """
-        logger.debug(f"Scan completed: {job.target} - {job.hosts_found} hosts, {job.ports_found} ports")
+        logger.debug("Scan completed: %s - %s hosts, %s ports", job.target, job.hosts_found, job.ports_found)
         # Emit signal to update UI on main thread
         self.scan_signals.completed.emit(job)
     
@@ -1375,7 +1395,7 @@ class MainWindow(QMainWindow):
         Args:
             job: Scan job with updated status
         """
-        logger.debug(f"Scan progress: {job.target} - {job.status.value}")
+        logger.debug("Scan progress: %s - %s", job.target, job.status.value)
         self.status_label.setText(f"Scanning {job.target}... ({job.status.value})")
         
         # Update progress in table
@@ -1421,8 +1441,8 @@ class MainWindow(QMainWindow):
             # Clear after 3 seconds
             QtCore.QTimer.singleShot(3000, lambda: self.hosts_model.clear_scan_progress(job.target))
         
-        # Refresh tables to show new data
-        self.refresh_data()
+        # Show the new data, repainting only the scanned hosts where possible
+        self._update_host_rows(job.host_ips)
         
         # Update scan button states
         self._update_scan_buttons()
@@ -1520,9 +1540,19 @@ class MainWindow(QMainWindow):
     
     def _on_settings(self) -> None:
         """Handle Settings action."""
+        # Imported on first use: the dialog module is not needed at startup
+        from legion.ui.settings import SettingsDialog
+        
         dialog = SettingsDialog(self.config_manager, self)
-        dialog.settings_changed.connect(self._on_settings_changed)
-        dialog.exec()
+        # The dialog emits from the GUI thread, so call the slot directly;
+        # a cross-thread emitter would need QueuedConnection instead
+        dialog.settings_changed.connect(
+            self._on_settings_changed, Qt.ConnectionType.DirectConnection
+        )
+        # Window-modal without a nested event loop; results arrive through
+        # settings_changed, so there is nothing to wait for here (the dialog
+        # deletes itself once closed and done saving)
+        dialog.open()
     
     def _on_clear_data(self) -> None:
         """Handle Clear All Data action."""
@@ -1633,10 +1663,15 @@ class MainWindow(QMainWindow):
             self.config_manager.save()
             logger.info(f"Theme changed to: {theme}")
     
-    def _on_settings_changed(self) -> None:
-        """Handle settings changed from settings dialog."""
-        # Reload config
-        self.config = self.config_manager.load()
+    def _on_settings_changed(self, config: LegionConfig) -> None:
+        """
+        Handle settings changed from settings dialog.
+        
+        Args:
+            config: The configuration the dialog just saved
+        """
+        # Use the saved config as-is; no need to read it back from disk
+        self.config = config
         
         # Apply theme if changed
         self._apply_theme(self.config.ui.theme)
@@ -2250,6 +2285,8 @@ class MainWindow(QMainWindow):
         
         hosts_imported = 0
         ports_imported = 0
+        hosts_batch = []
+        ports_batch = []
         
         # Handle both single host export and full project export
         hosts_data = data.get("hosts", [])
@@ -2272,8 +2309,8 @@ class MainWindow(QMainWindow):
                     last_seen=datetime.fromisoformat(host_data["last_seen"]) if host_data.get("last_seen") else datetime.now()
                 )
                 
-                # Save host to database
-                self.database.save_host(host)
+                # Queue host for database
+                hosts_batch.append(host)
                 hosts_imported += 1
                 
                 # Import ports
@@ -2287,18 +2324,22 @@ class MainWindow(QMainWindow):
                         last_seen=datetime.now()
                     )
                     
-                    self.database.save_port(host.ip, port)
+                    ports_batch.append((host.ip, port))
                     ports_imported += 1
                     
             except Exception as e:
                 logger.error(f"Failed to import host {host_data.get('ip', 'unknown')}: {e}")
                 continue
         
-        self.status_label.setText(f"Imported {hosts_imported} hosts, {ports_imported} ports from {filename}")
-        logger.info(f"Imported {hosts_imported} hosts, {ports_imported} ports from {filename}")
+        # Persist everything in one write per table
+        self.database.save_hosts(hosts_batch)
+        self.database.save_ports_bulk(ports_batch)
         
         # Refresh UI
-        self.hosts_model.refresh()
+        self._update_host_rows([host.ip for host in hosts_batch])
+        
+        self.status_label.setText(f"Imported {hosts_imported} hosts, {ports_imported} ports from {filename}")
+        logger.info(f"Imported {hosts_imported} hosts, {ports_imported} ports from {filename}")
         
         QMessageBox.information(
             self,
@@ -2324,25 +2365,21 @@ class MainWindow(QMainWindow):
             parser = NmapXMLParser()
             result = parser.parse_file(filename)
 
-            hosts_saved = 0
-            ports_saved = 0
-
-            # Save hosts and ports to database
-            for host in result.hosts:
-                if not host.ip:
-                    # Skip entries without IP
-                    continue
-                self.database.save_host(host)
-                hosts_saved += 1
-
-                host_ports = result.ports.get(host.ip, [])
-                for port in host_ports:
-                    self.database.save_port(host.ip, port)
-                    ports_saved += 1
+            # Save hosts and ports to database, skipping entries without IP
+            hosts = [host for host in result.hosts if host.ip]
+            port_pairs = [
+                (host.ip, port)
+                for host in hosts
+                for port in result.ports.get(host.ip, [])
+            ]
+            self.database.save_hosts(hosts)
+            self.database.save_ports_bulk(port_pairs)
+            hosts_saved = len(hosts)
+            ports_saved = len(port_pairs)
 
             # Refresh UI models
             if hasattr(self, "hosts_model"):
-                self.hosts_model.refresh()
+                self._update_host_rows([host.ip for host in hosts])
 
             # Update status and notify user
             self.status_label.setText(f"Imported {hosts_saved} hosts and {ports_saved} ports from {filename}")
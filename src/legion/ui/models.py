@@ -9,16 +9,24 @@ Provides QAbstractTableModel implementations for:
 These models bridge between legion.core.database and PyQt6 views.
 """
 
-from typing import Optional, Any, List
-from datetime import datetime
+from typing import Any, Callable, List, Optional
 
-from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject
 from PyQt6.QtGui import QColor
 
 from legion.core.database import SimpleDatabase
 from legion.core.models import Host, Port
 
 
+# Shared background colors (built once instead of per data() call)
+_COLOR_GREEN = QColor(200, 255, 200)         # Light green
+_COLOR_RED = QColor(255, 200, 200)           # Light red
+_COLOR_YELLOW = QColor(255, 255, 200)        # Light yellow
+_COLOR_NEW_OPEN = QColor(144, 238, 144)      # Light green - newly opened!
+_COLOR_NEW_CLOSED = QColor(255, 160, 160)    # Light red - newly closed!
+_COLOR_STILL_OPEN = QColor(230, 255, 230)    # Very light green - stable open
+
+
 class HostsTableModel(QAbstractTableModel):
     """
     Table model for displaying hosts from SimpleDatabase.
@@ -37,7 +45,13 @@ class HostsTableModel(QAbstractTableModel):
     
     HEADERS = ["IP Address", "Hostname", "Operating System", "State", "Open Ports", "Scan Progress", "Last Seen"]
     
-    def __init__(self, database: SimpleDatabase, parent: Optional[Any] = None):
+    # Role/orientation constants resolved once (enum access is slow in data())
+    _DISPLAY = int(Qt.ItemDataRole.DisplayRole)
+    _BG = int(Qt.ItemDataRole.BackgroundRole)
+    _TT = int(Qt.ItemDataRole.ToolTipRole)
+    _HORIZONTAL = Qt.Orientation.Horizontal
+    
+    def __init__(self, database: SimpleDatabase, parent: Optional[QObject] = None):
         """
         Initialize hosts table model.
         
@@ -49,6 +63,9 @@ class HostsTableModel(QAbstractTableModel):
         self.database = database
         self._hosts: List[Host] = []
         self._scan_progress: dict[str, tuple[str, int]] = {}  # ip -> (status, progress%)
+        self._open_port_counts: dict[str, int] = {}  # ip -> open port count
+        self._row_by_ip: dict[str, int] = {}  # ip -> row in self._hosts
+        self._dispatch = self._build_dispatch()
         self.refresh()
     
     def set_scan_progress(self, host_ip: str, status: str, progress: int = 0) -> None:
@@ -62,12 +79,11 @@ class HostsTableModel(QAbstractTableModel):
         """
         self._scan_progress[host_ip] = (status, progress)
         
-        # Find row for this host and emit dataChanged
-        for row, host in enumerate(self._hosts):
-            if host.ip == host_ip:
-                index = self.index(row, self.COL_PROGRESS)
-                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
-                break
+        # Emit dataChanged for this host's progress cell
+        row = self._row_by_ip.get(host_ip)
+        if row is not None:
+            index = self.index(row, self.COL_PROGRESS)
+            self.dataChanged.emit(index, index, [self._DISPLAY])
     
     def clear_scan_progress(self, host_ip: str) -> None:
         """Clear scan progress for a host."""
@@ -75,11 +91,10 @@ class HostsTableModel(QAbstractTableModel):
             del self._scan_progress[host_ip]
             
             # Update display
-            for row, host in enumerate(self._hosts):
-                if host.ip == host_ip:
-                    index = self.index(row, self.COL_PROGRESS)
-                    self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
-                    break
+            row = self._row_by_ip.get(host_ip)
+            if row is not None:
+                index = self.index(row, self.COL_PROGRESS)
+                self.dataChanged.emit(index, index, [self._DISPLAY])
     
     def clear_all_scan_progress(self) -> None:
         """Clear all scan progress indicators."""
@@ -90,14 +105,75 @@ class HostsTableModel(QAbstractTableModel):
             if self._hosts:
                 top_left = self.index(0, self.COL_PROGRESS)
                 bottom_right = self.index(len(self._hosts) - 1, self.COL_PROGRESS)
-                self.dataChanged.emit(top_left, bottom_right, [Qt.ItemDataRole.DisplayRole])
+                self.dataChanged.emit(top_left, bottom_right, [self._DISPLAY])
     
     def refresh(self) -> None:
         """Reload hosts from database."""
         self.beginResetModel()
         self._hosts = self.database.get_all_hosts()
+        self._open_port_counts = self.database.get_open_port_counts()
+        self._row_by_ip = {host.ip: row for row, host in enumerate(self._hosts)}
         self.endResetModel()
     
+    def row_for_ip(self, host_ip: str) -> Optional[int]:
+        """
+        Get the row of a host without scanning the host list.
+        
+        Args:
+            host_ip: Host IP address
+            
+        Returns:
+            Row number or None if the host is not in the model
+        """
+        return self._row_by_ip.get(host_ip)
+    
+    def update_hosts(self, host_ips: List[str]) -> int:
+        """
+        Reload several hosts and repaint them with batched dataChanged.
+        
+        Changed rows are coalesced into contiguous ranges so a scan that
+        touches many hosts emits one signal per block, not one per cell.
+        
+        Args:
+            host_ips: Host IP addresses
+            
+        Returns:
+            Number of rows updated (hosts not in the model are skipped)
+        """
+        rows = []
+        for host_ip in host_ips:
+            row = self._row_by_ip.get(host_ip)
+            host = self.database.get_host(host_ip)
+            if row is None or host is None:
+                continue
+            self._hosts[row] = host
+            self._open_port_counts[host_ip] = len(self.database.get_open_ports(host_ip))
+            rows.append(row)
+        
+        self._emit_rows_changed(rows, [self._DISPLAY, self._BG, self._TT])
+        return len(rows)
+    
+    def _emit_rows_changed(self, rows: List[int], roles: List[int]) -> None:
+        """
+        Emit one dataChanged per contiguous block of rows.
+        
+        Args:
+            rows: Changed row numbers (any order, duplicates allowed)
+            roles: Roles affected, so views can skip the others
+        """
+        if not rows:
+            return
+        
+        last_col = self.columnCount() - 1
+        ordered = sorted(set(rows))
+        start = prev = ordered[0]
+        for row in ordered[1:]:
+            if row != prev + 1:
+                self.dataChanged.emit(self.index(start, 0), self.index(prev, last_col), roles)
+                start = row
+            prev = row
+        self.dataChanged.emit(self.index(start, 0), self.index(prev, last_col), roles)
+    
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of rows."""
         if parent.isValid():
@@ -110,6 +186,31 @@ class HostsTableModel(QAbstractTableModel):
             return 0
         return len(self.HEADERS)
     
+    def _build_dispatch(self) -> dict[tuple[int, int], Callable[[Host], Any]]:
+        """
+        Build the (role, column) -> handler table used by data().
+        
+        Returns:
+            Dispatch table; missing keys mean "no data" for that cell
+        """
+        dispatch: dict[tuple[int, int], Callable[[Host], Any]] = {
+            (self._DISPLAY, self.COL_IP): lambda h: h.ip,
+            (self._DISPLAY, self.COL_HOSTNAME): lambda h: h.hostname or "",
+            (self._DISPLAY, self.COL_OS): self._display_os,
+            (self._DISPLAY, self.COL_STATE): lambda h: h.state or "unknown",
+            (self._DISPLAY, self.COL_PORTS): self._display_ports,
+            (self._DISPLAY, self.COL_PROGRESS): self._display_progress,
+            (self._DISPLAY, self.COL_LAST_SEEN): self._display_last_seen,
+        }
+        for col in range(len(self.HEADERS)):
+            if col == self.COL_PROGRESS:
+                dispatch[(self._BG, col)] = self._progress_background
+                dispatch[(self._TT, col)] = self._progress_tooltip
+            else:
+                dispatch[(self._BG, col)] = self._state_background
+                dispatch[(self._TT, col)] = self._host_tooltip
+        return dispatch
+    
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         """
         Get data for index and role.
@@ -121,95 +222,96 @@ class HostsTableModel(QAbstractTableModel):
         Returns:
             Data for the given index and role
         """
-        if not index.isValid() or not (0 <= index.row() < len(self._hosts)):
-            return QVariant()
+        # Invalid indexes have column -1, so they never match a handler
+        fn = self._dispatch.get((role, index.column()))
+        if fn is None:
+            return None
         
-        host = self._hosts[index.row()]
-        col = index.column()
-        
-        # Display role
-        if role == Qt.ItemDataRole.DisplayRole:
-            if col == self.COL_IP:
-                return host.ip
-            elif col == self.COL_HOSTNAME:
-                return host.hostname or ""
-            elif col == self.COL_OS:
-                if host.os_name:
-                    accuracy = f" ({host.os_accuracy}%)" if host.os_accuracy else ""
-                    return f"{host.os_name}{accuracy}"
-                return ""
-            elif col == self.COL_STATE:
-                return host.state or "unknown"
-            elif col == self.COL_PORTS:
-                # Count open ports for this host
-                ports = self.database.get_ports(host.ip)
-                open_count = sum(1 for p in ports if p.state == "open")
-                return str(open_count)
-            elif col == self.COL_PROGRESS:
-                # Show scan progress
-                if host.ip in self._scan_progress:
-                    status, progress = self._scan_progress[host.ip]
-                    if progress > 0:
-                        return f"{status} ({progress}%)"
-                    return status
-                return ""
-            elif col == self.COL_LAST_SEEN:
-                if host.last_seen:
-                    # Format datetime nicely
-                    if isinstance(host.last_seen, str):
-                        return host.last_seen
-                    return host.last_seen.strftime("%Y-%m-%d %H:%M:%S")
-                return ""
-        
-        # Background color role (color-code by state)
-        elif role == Qt.ItemDataRole.BackgroundRole:
-            if col == self.COL_PROGRESS:
-                # Color-code progress column
-                if host.ip in self._scan_progress:
-                    status, progress = self._scan_progress[host.ip]
-                    if "Complete" in status or "Done" in status:
-                        return QColor(200, 255, 200)  # Light green
-                    elif "Failed" in status or "Error" in status:
-                        return QColor(255, 200, 200)  # Light red
-                    elif "Scanning" in status or "Running" in status:
-                        return QColor(255, 255, 200)  # Light yellow
-                return QVariant()
-            
-            if host.state == "up":
-                return QColor(200, 255, 200)  # Light green
-            elif host.state == "down":
-                return QColor(255, 200, 200)  # Light red
+        row = index.row()
+        hosts = self._hosts
+        if not (0 <= row < len(hosts)):
+            return None
+        return fn(hosts[row])
+    
+    # Display role handlers
+    
+    def _display_os(self, host: Host) -> str:
+        if host.os_name:
+            accuracy = f" ({host.os_accuracy}%)" if host.os_accuracy else ""
+            return f"{host.os_name}{accuracy}"
+        return ""
+    
+    def _display_ports(self, host: Host) -> str:
+        # Open port counts are aggregated once per refresh()
+        return str(self._open_port_counts.get(host.ip, 0))
+    
+    def _display_progress(self, host: Host) -> str:
+        # Show scan progress
+        if host.ip in self._scan_progress:
+            status, progress = self._scan_progress[host.ip]
+            if progress > 0:
+                return f"{status} ({progress}%)"
+            return status
+        return ""
+    
+    def _display_last_seen(self, host: Host) -> str:
+        if host.last_seen:
+            # Format datetime nicely
+            if isinstance(host.last_seen, str):
+                return host.last_seen
+            return host.last_seen.strftime("%Y-%m-%d %H:%M:%S")
+        return ""
+    
+    # Background color role handlers (color-code by state)
+    
+    def _progress_background(self, host: Host) -> Optional[QColor]:
+        # Color-code progress column
+        if host.ip in self._scan_progress:
+            status, progress = self._scan_progress[host.ip]
+            if "Complete" in status or "Done" in status:
+                return _COLOR_GREEN
+            elif "Failed" in status or "Error" in status:
+                return _COLOR_RED
+            elif "Scanning" in status or "Running" in status:
+                return _COLOR_YELLOW
+        return None
+    
+    def _state_background(self, host: Host) -> Optional[QColor]:
+        if host.state == "up":
+            return _COLOR_GREEN
+        elif host.state == "down":
+            return _COLOR_RED
+        return None
+    
+    # Tooltip role handlers
+    
+    def _progress_tooltip(self, host: Host) -> str:
+        # Progress column tooltip
+        if host.ip in self._scan_progress:
+            status, progress = self._scan_progress[host.ip]
+            return f"Scan Status: {status}\nProgress: {progress}%"
+        return "No active scan"
+    
+    def _host_tooltip(self, host: Host) -> str:
+        # General host tooltip
+        tooltip = f"IP: {host.ip}\n"
+        if host.hostname:
+            tooltip += f"Hostname: {host.hostname}\n"
+        if host.mac_address:
+            tooltip += f"MAC: {host.mac_address}\n"
+        if host.vendor:
+            tooltip += f"Vendor: {host.vendor}\n"
+        if host.os_name:
+            tooltip += f"OS: {host.os_name}"
+            if host.os_accuracy:
+                tooltip += f" ({host.os_accuracy}%)"
         
-        # Tooltip role
-        elif role == Qt.ItemDataRole.ToolTipRole:
-            if col == self.COL_PROGRESS:
-                # Progress column tooltip
-                if host.ip in self._scan_progress:
-                    status, progress = self._scan_progress[host.ip]
-                    return f"Scan Status: {status}\nProgress: {progress}%"
-                return "No active scan"
-            
-            # General host tooltip
-            tooltip = f"IP: {host.ip}\n"
-            if host.hostname:
-                tooltip += f"Hostname: {host.hostname}\n"
-            if host.mac_address:
-                tooltip += f"MAC: {host.mac_address}\n"
-            if host.vendor:
-                tooltip += f"Vendor: {host.vendor}\n"
-            if host.os_name:
-                tooltip += f"OS: {host.os_name}"
-                if host.os_accuracy:
-                    tooltip += f" ({host.os_accuracy}%)"
-            
-            # Add scan progress to tooltip
-            if host.ip in self._scan_progress:
-                status, progress = self._scan_progress[host.ip]
-                tooltip += f"\n\nScan: {status} ({progress}%)"
-            
-            return tooltip
+        # Add scan progress to tooltip
+        if host.ip in self._scan_progress:
+            status, progress = self._scan_progress[host.ip]
+            tooltip += f"\n\nScan: {status} ({progress}%)"
         
-        return QVariant()
+        return tooltip
     
     def headerData(
         self,
@@ -228,13 +330,13 @@ class HostsTableModel(QAbstractTableModel):
         Returns:
             Header data
         """
-        if role == Qt.ItemDataRole.DisplayRole:
-            if orientation == Qt.Orientation.Horizontal:
+        if role == self._DISPLAY:
+            if orientation is self._HORIZONTAL:
                 if 0 <= section < len(self.HEADERS):
                     return self.HEADERS[section]
             else:
                 return str(section + 1)
-        return QVariant()
+        return None
     
     def get_host(self, row: int) -> Optional[Host]:
         """
@@ -268,7 +370,13 @@ class PortsTableModel(QAbstractTableModel):
     
     HEADERS = ["Port", "Protocol", "State", "Service", "Version", "Status"]
     
-    def __init__(self, database: SimpleDatabase, parent: Optional[Any] = None):
+    # Role/orientation constants resolved once (enum access is slow in data())
+    _DISPLAY = int(Qt.ItemDataRole.DisplayRole)
+    _BG = int(Qt.ItemDataRole.BackgroundRole)
+    _TT = int(Qt.ItemDataRole.ToolTipRole)
+    _HORIZONTAL = Qt.Orientation.Horizontal
+    
+    def __init__(self, database: SimpleDatabase, parent: Optional[QObject] = None):
         """
         Initialize ports table model.
         
@@ -324,13 +432,13 @@ class PortsTableModel(QAbstractTableModel):
             Data for the given index and role
         """
         if not index.isValid() or not (0 <= index.row() < len(self._ports)):
-            return QVariant()
+            return None
         
         port = self._ports[index.row()]
         col = index.column()
         
         # Display role
-        if role == Qt.ItemDataRole.DisplayRole:
+        if role == self._DISPLAY:
             if col == self.COL_PORT:
                 return str(port.number)
             elif col == self.COL_PROTOCOL:
@@ -360,25 +468,25 @@ class PortsTableModel(QAbstractTableModel):
                 return labels.get(change, "")
         
         # Background color role (color-code by status change)
-        elif role == Qt.ItemDataRole.BackgroundRole:
+        elif role == self._BG:
             change = port.status_change
             
             # Priority: Status change colors override state colors
             if change == "new_open":
-                return QColor(144, 238, 144)  # Light green - newly opened!
+                return _COLOR_NEW_OPEN
             elif change == "new_closed":
-                return QColor(255, 160, 160)  # Light red - newly closed!
+                return _COLOR_NEW_CLOSED
             elif change == "still_open":
-                return QColor(230, 255, 230)  # Very light green - stable open
+                return _COLOR_STILL_OPEN
             elif port.state == "open":
-                return QColor(200, 255, 200)  # Light green - open (no history)
+                return _COLOR_GREEN  # Open (no history)
             elif port.state == "closed":
-                return QColor(255, 200, 200)  # Light red
+                return _COLOR_RED
             elif port.state == "filtered":
-                return QColor(255, 255, 200)  # Light yellow
+                return _COLOR_YELLOW
         
         # Tooltip role
-        elif role == Qt.ItemDataRole.ToolTipRole:
+        elif role == self._TT:
             tooltip = f"Port: {port.number}/{port.protocol}\n"
             tooltip += f"State: {port.state}\n"
             
@@ -402,7 +510,7 @@ class PortsTableModel(QAbstractTableModel):
                     tooltip += f" {port.service_version}"
             return tooltip
         
-        return QVariant()
+        return None
     
     def headerData(
         self,
@@ -421,13 +529,13 @@ class PortsTableModel(QAbstractTableModel):
         Returns:
             Header data
         """
-        if role == Qt.ItemDataRole.DisplayRole:
-            if orientation == Qt.Orientation.Horizontal:
+        if role == self._DISPLAY:
+            if orientation is self._HORIZONTAL:
                 if 0 <= section < len(self.HEADERS):
                     return self.HEADERS[section]
             else:
                 return str(section + 1)
-        return QVariant()
+        return None
     
     def get_port(self, row: int) -> Optional[Port]:
         """
@@ -461,14 +569,12 @@ if __name__ == "__main__":
     host1 = Host(ip="192.168.1.1", hostname="router.local", state="up", os_name="Linux 3.x")
     host2 = Host(ip="192.168.1.100", hostname="workstation", state="up", os_name="Windows 10")
     
-    db.save_host(host1)
-    db.save_host(host2)
+    db.save_hosts([host1, host2])
     
     port1 = Port(number=22, protocol="tcp", state="open", service_name="ssh", service_product="OpenSSH")
     port2 = Port(number=80, protocol="tcp", state="open", service_name="http", service_product="Apache")
     
-    db.save_port("192.168.1.1", port1)
-    db.save_port("192.168.1.1", port2)
+    db.save_ports_bulk([("192.168.1.1", port1), ("192.168.1.1", port2)])
     
     print(f"Created test database with {len(db.get_all_hosts())} hosts")
     
@@ -0,0 +1,223 @@
+"""
+Tests for the Legion Qt table models.
+
+Runs the models against a throwaway SimpleDatabase project:
+- Blank cells and unhandled roles reach views as invalid data
+- Batched dataChanged ranges for host updates
+"""
+
+import os
+import shutil
+import uuid
+
+# Models only, no windows: the offscreen platform works without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt, QModelIndex, QVariant
+from PyQt6.QtWidgets import QApplication
+
+from legion.core.database import SimpleDatabase
+from legion.core.models import Host, Port
+from legion.ui.models import HostsTableModel, PortsTableModel
+
+
+_app = QApplication.instance() or QApplication([])
+
+
+def _make_database(host_count: int) -> SimpleDatabase:
+    """Create a temporary project holding hosts 10.0.0.0 .. 10.0.0.<n-1>."""
+    db = SimpleDatabase(project_name=f"models_test_{uuid.uuid4().hex}")
+    db.save_hosts(Host(ip=f"10.0.0.{i}", state="up") for i in range(host_count))
+    return db
+
+
+def _is_blank(value: object) -> bool:
+    """True for None or an invalid QVariant (views see both as no data)."""
+    return value is None or (isinstance(value, QVariant) and not value.isValid())
+
+
+def test_blank_cells() -> bool:
+    """Test that empty cells and unhandled roles come back as invalid data."""
+    print("\n[TEST] Blank Cells")
+    print("-" * 60)
+    
+    display = int(Qt.ItemDataRole.DisplayRole)
+    background = int(Qt.ItemDataRole.BackgroundRole)
+    tooltip = int(Qt.ItemDataRole.ToolTipRole)
+    # Roles views probe per cell that the models never answer
+    unhandled = [
+        Qt.ItemDataRole.EditRole,
+        Qt.ItemDataRole.DecorationRole,
+        Qt.ItemDataRole.FontRole,
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.CheckStateRole,
+        Qt.ItemDataRole.SizeHintRole,
+        Qt.ItemDataRole.TextAlignmentRole,
+        Qt.ItemDataRole.UserRole,
+    ]
+    
+    db = _make_database(0)
+    try:
+        db.save_hosts([
+            Host(ip="10.0.0.1"),  # No hostname/OS, state "unknown"
+            Host(ip="10.0.0.2", state="up", hostname="web", os_name="Linux", os_accuracy=95),
+        ])
+        db.save_ports_bulk([("10.0.0.1", Port(number=22))])
+        hosts = HostsTableModel(db)
+        
+        # Test 1: Display values of a bare host (same strings as before)
+        row = [hosts.data(hosts.index(0, col)) for col in range(hosts.columnCount())]
+        expected = ["10.0.0.1", "", "", "unknown", "0", ""]
+        if row[:6] != expected or not isinstance(row[6], str):
+            print(f"[FAIL] Bare host displays {row}")
+            return False
+        if hosts.data(hosts.index(1, hosts.COL_OS)) != "Linux (95%)":
+            print("[FAIL] OS column lost its accuracy suffix")
+            return False
+        print("[PASS] Blank display cells are empty strings")
+        
+        # Test 2: Roles a view receives per cell (itemData() goes through
+        # QVariant, so None and QVariant() both show up as "no data")
+        for col in range(hosts.columnCount()):
+            bare = set(hosts.itemData(hosts.index(0, col)))
+            up = set(hosts.itemData(hosts.index(1, col)))
+            up_expected = {display, tooltip}
+            if col != hosts.COL_PROGRESS:
+                up_expected.add(background)
+            if bare != {display, tooltip} or up != up_expected:
+                print(f"[FAIL] Column {col} roles: bare={bare}, up={up}")
+                return False
+        print("[PASS] Only display/background/tooltip roles carry data")
+        
+        # Test 3: Unhandled roles, invalid indexes and headers
+        for col in range(hosts.columnCount()):
+            for role in unhandled:
+                value = hosts.index(0, col).data(role)
+                if value is not None:
+                    print(f"[FAIL] Column {col} role {role} returned {value!r}")
+                    return False
+        if not _is_blank(hosts.data(QModelIndex())):
+            print("[FAIL] Invalid index returned data")
+            return False
+        if not _is_blank(hosts.headerData(0, Qt.Orientation.Horizontal, Qt.ItemDataRole.FontRole)):
+            print("[FAIL] Header returned data for FontRole")
+            return False
+        print("[PASS] Unhandled roles return no data")
+        
+        # Test 4: Ports model blanks
+        ports = PortsTableModel(db)
+        ports.set_host("10.0.0.1")
+        for col in range(ports.columnCount()):
+            roles = set(ports.itemData(ports.index(0, col)))
+            if roles != {display, tooltip}:
+                print(f"[FAIL] Port column {col} roles: {roles}")
+                return False
+        if ports.data(ports.index(0, ports.COL_VERSION)) != "":
+            print("[FAIL] Empty port version is not blank")
+            return False
+        print("[PASS] Ports model blanks unchanged")
+    finally:
+        shutil.rmtree(db.base_dir, ignore_errors=True)
+    
+    return True
+
+
+def test_row_range_coalescing() -> bool:
+    """Test that changed rows are emitted as contiguous blocks."""
+    print("\n[TEST] Row Range Coalescing")
+    print("-" * 60)
+    
+    db = _make_database(8)
+    try:
+        model = HostsTableModel(db)
+        last_col = model.columnCount() - 1
+        roles = [int(Qt.ItemDataRole.DisplayRole), int(Qt.ItemDataRole.BackgroundRole)]
+        emitted = []
+        model.dataChanged.connect(
+            lambda top_left, bottom_right, r: emitted.append(
+                (top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column(), list(r))
+            )
+        )
+        
+        # Test 1: Unordered rows with duplicates -> one signal per block
+        model._emit_rows_changed([5, 1, 2, 3, 7, 2], roles)
+        expected = [
+            (1, 0, 3, last_col, roles),
+            (5, 0, 5, last_col, roles),
+            (7, 0, 7, last_col, roles),
+        ]
+        if emitted != expected:
+            print(f"[FAIL] Expected {expected}, got {emitted}")
+            return False
+        print("[PASS] Rows [5,1,2,3,7] coalesced into 3 ranges")
+        
+        # Test 2: No rows -> no signal
+        emitted.clear()
+        model._emit_rows_changed([], roles)
+        if emitted:
+            print(f"[FAIL] Empty update emitted {emitted}")
+            return False
+        print("[PASS] Empty update emits nothing")
+        
+        # Test 3: update_hosts() reloads known hosts and skips unknown ones
+        db.save_host(Host(ip="10.0.0.4", state="down"))
+        updated = model.update_hosts(["10.0.0.5", "10.0.0.4", "10.9.9.9"])
+        if updated != 2 or [(e[0], e[2]) for e in emitted] != [(4, 5)]:
+            print(f"[FAIL] update_hosts: {updated} updated, emitted {emitted}")
+            return False
+        state = model.data(model.index(4, model.COL_STATE))
+        if state != "down":
+            print(f"[FAIL] Row 4 state not reloaded: {state!r}")
+            return False
+        print("[PASS] update_hosts() repaints rows 4-5 in one signal")
+    finally:
+        shutil.rmtree(db.base_dir, ignore_errors=True)
+    
+    return True
+
+
+def run_all_tests() -> bool:
+    """Run all model tests."""
+    print("=" * 60)
+    print("LEGION TABLE MODELS - TESTS")
+    print("=" * 60)
+    
+    tests = [
+        ("Blank Cells", test_blank_cells),
+        ("Row Range Coalescing", test_row_range_coalescing),
+    ]
+    
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n[ERROR] Test '{name}' crashed: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+    
+    # Summary
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    
+    for name, passed in results:
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"{status} {name}")
+    
+    total = len(results)
+    passed = sum(1 for _, p in results if p)
+    
+    print("\n" + "=" * 60)
+    print(f"Results: {passed}/{total} tests passed")
+    print("=" * 60)
+    
+    return passed == total
+
+
+if __name__ == "__main__":
+    import sys
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -10,40 +10,289 @@ Displays credentials with:
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Callable, List, Dict, Optional, Set, Tuple
 from datetime import datetime
 import logging
+import os
+import sys
 import json
 import csv
+from contextlib import contextmanager
+from operator import itemgetter
+from dataclasses import dataclass, field
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTreeWidget,
-    QTreeWidgetItem, QHeaderView, QLabel, QMenu, QFileDialog, QMessageBox
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTreeView,
+    QHeaderView, QLabel, QMenu, QFileDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QClipboard, QGuiApplication
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractItemModel, QModelIndex, QObject, QRunnable, QSignalBlocker,
+    QThreadPool
+)
+from PyQt6.QtGui import QColor, QFont, QClipboard, QGuiApplication
+
+try:
+    import orjson  # Optional: C-accelerated JSON export
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Target row style (bold, green), shared by every row the model paints.
+# QColor is a plain value and can be built at import time; QFont wants a
+# QGuiApplication, so it is created on first use.
+_PARENT_FG = QColor(0x5c, 0xb8, 0x5c)
+_BOLD_FONT: Optional[QFont] = None
+
 
+@dataclass(slots=True)
 class CredentialResult:
     """A single credential result."""
     
-    def __init__(
-        self,
-        host: str,
-        port: int,
-        service: str,
-        username: str,
-        password: str,
-        found_at: datetime
-    ):
-        self.host = host
-        self.port = port
-        self.service = service
-        self.username = username
-        self.password = password
-        self.found_at = found_at
+    host: str
+    port: int
+    service: str
+    username: str
+    password: str
+    found_at: datetime
+    # Formatted once; used by every tree paint and export
+    found_at_str: str = field(default="", init=False)
+    found_at_iso: str = field(default="", init=False)
+    
+    def __post_init__(self) -> None:
+        # A handful of targets yield thousands of credentials; share one
+        # string object per host/service (also speeds up key comparisons)
+        self.host = sys.intern(self.host)
+        self.service = sys.intern(self.service)
+        self.found_at_str = self.found_at.strftime("%Y-%m-%d %H:%M:%S")
+        self.found_at_iso = self.found_at.isoformat()
+
+
+class CredentialsModel(QAbstractItemModel):
+    """
+    Tree model over the grouped credential store.
+    
+    Top-level rows are targets (host, port, service); their children are the
+    credentials found for that target. Rows are rendered on demand through
+    data(), so only visible rows cost anything.
+    
+    Child indexes carry their parent's key tuple as internal pointer; the
+    tuple is owned by ``_keys`` and stays alive as long as the row exists.
+    
+    Credential rows are fetched lazily: a target reports no children until
+    the view expands it and calls fetchMore().
+    """
+    
+    # Column definitions
+    COL_TARGET = 0
+    COL_SERVICE = 1
+    COL_CREDENTIALS = 2
+    COL_FOUND_AT = 3
+    
+    HEADERS = ["Target", "Service", "Credentials", "Found At"]
+    
+    @classmethod
+    def _bold_font(cls) -> QFont:
+        """Return the shared bold target-row font, creating it on first use."""
+        global _BOLD_FONT
+        if _BOLD_FONT is None:
+            _BOLD_FONT = QFont()
+            _BOLD_FONT.setBold(True)
+        return _BOLD_FONT
+    
+    def __init__(self, credentials: Dict[tuple, List[CredentialResult]], parent=None):
+        """
+        Initialize credentials model.
+        
+        Args:
+            credentials: Shared store {(host, port, service): [CredentialResult]}
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._credentials = credentials
+        self._keys: List[tuple] = []  # Top-level row order
+        self._row_by_key: Dict[tuple, int] = {}  # key -> top-level row
+        self._unfetched: Set[tuple] = set()  # Targets whose children are not exposed yet
+    
+    def refresh(self) -> None:
+        """Rebuild top-level rows (sorted) from the credential store."""
+        self.beginResetModel()
+        self._keys = sorted(self._credentials)
+        self._row_by_key = {key: row for row, key in enumerate(self._keys)}
+        self._unfetched = set(self._keys)
+        self.endResetModel()
+    
+    def add_credential(self, cred: CredentialResult) -> None:
+        """
+        Append a credential to the store and insert its row.
+        
+        Args:
+            cred: Credential to add
+        """
+        key = (cred.host, cred.port, cred.service)
+        
+        if key not in self._credentials:
+            # New target: children are fetched when it is first expanded
+            row = len(self._keys)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._credentials[key] = [cred]
+            self._keys.append(key)
+            self._row_by_key[key] = row
+            self._unfetched.add(key)
+            self.endInsertRows()
+            return
+        
+        creds = self._credentials[key]
+        parent_index = self.index(self._row_by_key[key], 0)
+        if key in self._unfetched:
+            creds.append(cred)
+        else:
+            self.beginInsertRows(parent_index, len(creds), len(creds))
+            creds.append(cred)
+            self.endInsertRows()
+        
+        # Parent shows the credential count
+        count_index = parent_index.siblingAtColumn(self.COL_CREDENTIALS)
+        self.dataChanged.emit(count_index, count_index)
+    
+    def credential_at(self, index: QModelIndex) -> Optional[CredentialResult]:
+        """
+        Get the credential for a child index.
+        
+        Args:
+            index: Model index
+            
+        Returns:
+            CredentialResult, or None for target rows / invalid indexes
+        """
+        if not index.isValid():
+            return None
+        key = index.internalPointer()
+        if key is None:
+            return None
+        return self._credentials[key][index.row()]
+    
+    def credentials_for(self, index: QModelIndex) -> List[CredentialResult]:
+        """
+        Get all credentials under a target index.
+        
+        Args:
+            index: Model index of a target row
+            
+        Returns:
+            List of credentials (empty for child / invalid indexes)
+        """
+        if not index.isValid() or index.internalPointer() is not None:
+            return []
+        return self._credentials[self._keys[index.row()]]
+    
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Create index for row/column under parent."""
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, None)
+        return self.createIndex(row, column, self._keys[parent.row()])
+    
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        """Return parent of index (targets have no parent)."""
+        if not index.isValid():
+            return QModelIndex()
+        key = index.internalPointer()
+        if key is None:
+            return QModelIndex()
+        return self.createIndex(self._row_by_key[key], 0, None)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of targets, or credentials under a target."""
+        if not parent.isValid():
+            return len(self._keys)
+        if parent.internalPointer() is None and parent.column() == 0:
+            key = self._keys[parent.row()]
+            if key in self._unfetched:
+                return 0
+            return len(self._credentials[key])
+        return 0
+    
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Targets always have children (even before they are fetched)."""
+        if not parent.isValid():
+            return bool(self._keys)
+        return parent.internalPointer() is None and parent.column() == 0
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Return True if the target's credential rows are not exposed yet."""
+        if not parent.isValid() or parent.internalPointer() is not None:
+            return False
+        return self._keys[parent.row()] in self._unfetched
+    
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Expose all credential rows of a target."""
+        if not self.canFetchMore(parent):
+            return
+        key = self._keys[parent.row()]
+        count = len(self._credentials[key])
+        self.beginInsertRows(parent.siblingAtColumn(0), 0, count - 1)
+        self._unfetched.discard(key)
+        self.endInsertRows()
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of columns."""
+        return len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        Get data for index and role.
+        
+        Args:
+            index: Model index
+            role: Data role
+            
+        Returns:
+            Data for the given index and role
+        """
+        if not index.isValid():
+            return None
+        
+        key = index.internalPointer()
+        col = index.column()
+        
+        if key is None:
+            # Target row
+            if role == Qt.ItemDataRole.DisplayRole:
+                host, port, service = self._keys[index.row()]
+                if col == self.COL_TARGET:
+                    return f"{host}:{port}"
+                elif col == self.COL_SERVICE:
+                    return service
+                elif col == self.COL_CREDENTIALS:
+                    count = len(self._credentials[(host, port, service)])
+                    return f"{count} credential{'s' if count != 1 else ''}"
+                return ""
+            elif role == Qt.ItemDataRole.ForegroundRole:
+                return _PARENT_FG
+            elif role == Qt.ItemDataRole.FontRole:
+                return _BOLD_FONT or self._bold_font()
+            return None
+        
+        # Credential row
+        if role == Qt.ItemDataRole.DisplayRole:
+            cred = self._credentials[key][index.row()]
+            if col == self.COL_CREDENTIALS:
+                return f"{cred.username}:{cred.password}"
+            elif col == self.COL_FOUND_AT:
+                return cred.found_at_str
+            return ""
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        """Return header labels."""
+        if (role == Qt.ItemDataRole.DisplayRole and
+                orientation == Qt.Orientation.Horizontal and
+                0 <= section < len(self.HEADERS)):
+            return self.HEADERS[section]
+        return None
 
 
 class ResultsWidget(QWidget):
@@ -64,6 +313,23 @@ class ResultsWidget(QWidget):
         
         # Storage for credentials: {(host, port, service): [CredentialResult]}
         self.credentials: Dict[tuple, List[CredentialResult]] = {}
+        self.model = CredentialsModel(self.credentials, self)
+        
+        # Flat column store in discovery order; exports zip() over these
+        # instead of walking the grouped objects field by field
+        self._hosts: List[str] = []
+        self._ports: List[int] = []
+        self._services: List[str] = []
+        self._usernames: List[str] = []
+        self._passwords: List[str] = []
+        self._found_at_strs: List[str] = []
+        self._found_at_isos: List[str] = []
+        
+        # (host, port, service, username, password) already shown
+        self._seen: Set[tuple] = set()
+        
+        # Exports running on the thread pool
+        self._export_tasks: Set["_ExportTask"] = set()
         
         self._setup_ui()
     
@@ -100,10 +366,12 @@ class ResultsWidget(QWidget):
         
         layout.addLayout(header_layout)
         
-        # Tree widget (expandable rows)
-        self.tree = QTreeWidget()
-        self.tree.setColumnCount(4)
-        self.tree.setHeaderLabels(["Target", "Service", "Credentials", "Found At"])
+        # Tree view (expandable rows)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        # All rows are single-line with the same font: skip per-row sizing
+        self.tree.setUniformRowHeights(True)
+        self.tree.setItemsExpandable(True)
         self.tree.header().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         self.tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.tree.setAlternatingRowColors(True)
@@ -125,68 +393,17 @@ class ResultsWidget(QWidget):
         Args:
             cred: CredentialResult instance
         """
-        key = (cred.host, cred.port, cred.service)
-        
-        # Add to storage
-        if key not in self.credentials:
-            self.credentials[key] = []
-        self.credentials[key].append(cred)
+        if not self._mark_seen(cred):
+            logger.debug("Skipping duplicate credential: %s@%s:%s", cred.username, cred.host, cred.port)
+            return
         
-        # Update tree incrementally (more efficient than full rebuild)
-        self._add_credential_to_tree(cred, key)
+        # Model updates storage and inserts the row incrementally
+        self.model.add_credential(cred)
+        self._append_columns(cred)
+        self._update_stats()
         
         logger.info(f"Added credential: {cred.username}@{cred.host}:{cred.port}")
     
-    def _add_credential_to_tree(self, cred: CredentialResult, key: tuple) -> None:
-        """
-        Add a single credential to the tree incrementally.
-        
-        Args:
-            cred: Credential to add
-            key: (host, port, service) tuple
-        """
-        host, port, service = key
-        
-        # Find or create parent item
-        parent = None
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            if (item.text(0) == f"{host}:{port}" and 
-                item.text(1) == service):
-                parent = item
-                break
-        
-        # Create parent if not found
-        if not parent:
-            parent = QTreeWidgetItem(self.tree)
-            parent.setText(0, f"{host}:{port}")
-            parent.setText(1, service)
-            parent.setText(3, "")
-            
-            # Style parent (bold, green)
-            for col in range(4):
-                parent.setForeground(col, QColor("#5cb85c"))
-                font = parent.font(col)
-                font.setBold(True)
-                parent.setFont(col, font)
-        
-        # Update parent count
-        cred_count = len(self.credentials[key])
-        parent.setText(2, f"{cred_count} credential{'s' if cred_count != 1 else ''}")
-        
-        # Add child credential
-        child = QTreeWidgetItem(parent)
-        child.setText(0, "")
-        child.setText(1, "")
-        child.setText(2, f"{cred.username}:{cred.password}")
-        child.setText(3, cred.found_at.strftime("%Y-%m-%d %H:%M:%S"))
-        
-        # Store credential data
-        child.setData(0, Qt.ItemDataRole.UserRole, cred)
-        
-        # Update stats
-        self._update_stats()
-    
     def add_credentials_bulk(self, credentials: List[CredentialResult]) -> None:
         """
         Add multiple credentials at once.
@@ -194,14 +411,20 @@ class ResultsWidget(QWidget):
         Args:
             credentials: List of CredentialResult instances
         """
-        for cred in credentials:
-            key = (cred.host, cred.port, cred.service)
-            if key not in self.credentials:
-                self.credentials[key] = []
-            self.credentials[key].append(cred)
+        new_creds = [cred for cred in credentials if self._mark_seen(cred)]
         
-        self._rebuild_tree()
-        logger.info(f"Added {len(credentials)} credentials in bulk")
+        # Insert incrementally with painting suspended: one repaint at the
+        # end instead of a full rebuild of rows that are already shown
+        with self._batch_update():
+            for cred in new_creds:
+                self.model.add_credential(cred)
+                self._append_columns(cred)
+        
+        self._update_stats()
+        logger.info(
+            f"Added {len(new_creds)} credentials in bulk "
+            f"({len(credentials) - len(new_creds)} duplicates skipped)"
+        )
     
     def clear_all(self) -> None:
         """Clear all credentials."""
@@ -214,10 +437,44 @@ class ResultsWidget(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.credentials.clear()
-            self.tree.clear()
-            self._update_stats()
+            self._clear_columns()
+            self._seen.clear()
+            self._rebuild_tree()
             logger.info("Cleared all credentials")
     
+    def _mark_seen(self, cred: CredentialResult) -> bool:
+        """
+        Record a credential as shown.
+        
+        Args:
+            cred: Credential to record
+            
+        Returns:
+            False if the same host/port/service/username/password was
+            already added, True otherwise
+        """
+        sig = (cred.host, cred.port, cred.service, cred.username, cred.password)
+        if sig in self._seen:
+            return False
+        self._seen.add(sig)
+        return True
+    
+    def _append_columns(self, cred: CredentialResult) -> None:
+        """Append a credential to the flat column store."""
+        self._hosts.append(cred.host)
+        self._ports.append(cred.port)
+        self._services.append(cred.service)
+        self._usernames.append(cred.username)
+        self._passwords.append(cred.password)
+        self._found_at_strs.append(cred.found_at_str)
+        self._found_at_isos.append(cred.found_at_iso)
+    
+    def _clear_columns(self) -> None:
+        """Empty the flat column store."""
+        for column in (self._hosts, self._ports, self._services, self._usernames,
+                       self._passwords, self._found_at_strs, self._found_at_isos):
+            column.clear()
+    
     def get_all_credentials(self) -> List[CredentialResult]:
         """Get all credentials as a flat list."""
         all_creds = []
@@ -227,47 +484,45 @@ class ResultsWidget(QWidget):
     
     def _rebuild_tree(self) -> None:
         """Rebuild the entire tree from scratch."""
-        self.tree.clear()
-        
-        # Group by host:port:service
-        for (host, port, service), creds in sorted(self.credentials.items()):
-            # Create parent item (collapsed by default)
-            parent = QTreeWidgetItem(self.tree)
-            parent.setText(0, f"{host}:{port}")
-            parent.setText(1, service)
-            parent.setText(2, f"{len(creds)} credential{'s' if len(creds) != 1 else ''}")
-            parent.setText(3, "")
-            
-            # Style parent (bold, green)
-            for col in range(4):
-                parent.setForeground(col, QColor("#5cb85c"))
-                font = parent.font(col)
-                font.setBold(True)
-                parent.setFont(col, font)
-            
-            # Add children (credentials)
-            for cred in creds:
-                child = QTreeWidgetItem(parent)
-                child.setText(0, "")
-                child.setText(1, "")
-                child.setText(2, f"{cred.username}:{cred.password}")
-                child.setText(3, cred.found_at.strftime("%Y-%m-%d %H:%M:%S"))
-                
-                # Store credential data
-                child.setData(0, Qt.ItemDataRole.UserRole, cred)
-        
+        with self._batch_update():
+            self.model.refresh()
         self._update_stats()
     
+    @contextmanager
+    def _batch_update(self):
+        """
+        Suspend painting, view signals and header auto-sizing.
+        
+        ResizeToContents columns re-measure on every row change; switching
+        them to Fixed defers that to a single pass when the block exits.
+        """
+        header = self.tree.header()
+        auto_sized = [
+            col for col in range(1, header.count())
+            if header.sectionResizeMode(col) == QHeaderView.ResizeMode.ResizeToContents
+        ]
+        
+        self.tree.setUpdatesEnabled(False)
+        for col in auto_sized:
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Fixed)
+        try:
+            with QSignalBlocker(self.tree):
+                yield
+        finally:
+            for col in auto_sized:
+                header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+            self.tree.setUpdatesEnabled(True)
+    
     def _show_context_menu(self, position) -> None:
         """Show context menu for credential items."""
-        item = self.tree.itemAt(position)
-        if not item:
+        index = self.tree.indexAt(position)
+        if not index.isValid():
             return
         
         menu = QMenu(self)
         
         # Get credential data
-        cred = item.data(0, Qt.ItemDataRole.UserRole)
+        cred = self.model.credential_at(index)
         
         if cred:  # Child item (actual credential)
             copy_user_action = menu.addAction("Copy Username")
@@ -284,6 +539,8 @@ class ResultsWidget(QWidget):
                 self._copy_to_clipboard(f"{cred.username}:{cred.password}")
         
         else:  # Parent item (target)
+            target_index = index.siblingAtColumn(0)
+            
             expand_action = menu.addAction("Expand All")
             collapse_action = menu.addAction("Collapse All")
             menu.addSeparator()
@@ -292,19 +549,16 @@ class ResultsWidget(QWidget):
             action = menu.exec(self.tree.viewport().mapToGlobal(position))
             
             if action == expand_action:
-                item.setExpanded(True)
-                for i in range(item.childCount()):
-                    item.child(i).setExpanded(True)
+                # Expands the target and everything below it in one pass
+                self.tree.expandRecursively(target_index)
             elif action == collapse_action:
-                item.setExpanded(False)
+                self.tree.collapse(target_index)
             elif action == copy_all_action:
                 # Copy all credentials under this target
-                creds_text = []
-                for i in range(item.childCount()):
-                    child = item.child(i)
-                    cred_data = child.data(0, Qt.ItemDataRole.UserRole)
-                    if cred_data:
-                        creds_text.append(f"{cred_data.username}:{cred_data.password}")
+                creds_text = [
+                    f"{c.username}:{c.password}"
+                    for c in self.model.credentials_for(target_index)
+                ]
                 self._copy_to_clipboard("\n".join(creds_text))
     
     def _copy_to_clipboard(self, text: str) -> None:
@@ -324,128 +578,96 @@ class ResultsWidget(QWidget):
             QMessageBox.information(self, "Export", "No credentials to export")
             return
         
-        # Get all credentials
-        all_creds = self.get_all_credentials()
-        
         # File dialog
         if format == "csv":
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export CSV", "", "CSV Files (*.csv)"
             )
             if filename:
-                self._export_csv(filename, all_creds)
+                self._export_csv(filename)
         
         elif format == "json":
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export JSON", "", "JSON Files (*.json)"
             )
             if filename:
-                self._export_json(filename, all_creds)
+                self._export_json(filename)
         
         elif format == "txt":
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export TXT", "", "Text Files (*.txt)"
             )
             if filename:
-                self._export_txt(filename, all_creds)
+                self._export_txt(filename)
     
-    def _export_csv(self, filename: str, credentials: List[CredentialResult]) -> None:
+    def _export_csv(self, filename: str) -> None:
         """Export to CSV format."""
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Host", "Port", "Service", "Username", "Password", "Found At"])
-                for cred in credentials:
-                    writer.writerow([
-                        cred.host,
-                        cred.port,
-                        cred.service,
-                        cred.username,
-                        cred.password,
-                        cred.found_at.strftime("%Y-%m-%d %H:%M:%S")
-                    ])
-            logger.info(f"Exported {len(credentials)} credentials to CSV: {filename}")
-            QMessageBox.information(self, "Export", f"Exported {len(credentials)} credentials to {filename}")
-        except Exception as e:
-            logger.error(f"Failed to export CSV: {e}")
-            QMessageBox.critical(self, "Export Error", f"Failed to export CSV:\n{e}")
+        self._start_export("CSV", _write_csv, filename)
     
-    def _export_json(self, filename: str, credentials: List[CredentialResult]) -> None:
+    def _export_json(self, filename: str) -> None:
         """Export to JSON format."""
-        try:
-            data = []
-            for cred in credentials:
-                data.append({
-                    "host": cred.host,
-                    "port": cred.port,
-                    "service": cred.service,
-                    "username": cred.username,
-                    "password": cred.password,
-                    "found_at": cred.found_at.isoformat()
-                })
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            
-            logger.info(f"Exported {len(credentials)} credentials to JSON: {filename}")
-            QMessageBox.information(self, "Export", f"Exported {len(credentials)} credentials to {filename}")
-        except Exception as e:
-            logger.error(f"Failed to export JSON: {e}")
-            QMessageBox.critical(self, "Export Error", f"Failed to export JSON:\n{e}")
+        self._start_export("JSON", _write_json, filename)
     
-    def _export_txt(self, filename: str, credentials: List[CredentialResult]) -> None:
+    def _export_txt(self, filename: str) -> None:
         """Export to TXT format with full scan information."""
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                # Header
-                f.write("="*70 + "\n")
-                f.write("LEGION HYDRA SCAN RESULTS\n")
-                f.write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total Credentials Found: {len(credentials)}\n")
-                f.write("="*70 + "\n\n")
-                
-                # Group by target
-                targets = {}
-                for cred in credentials:
-                    key = (cred.host, cred.port, cred.service)
-                    if key not in targets:
-                        targets[key] = []
-                    targets[key].append(cred)
-                
-                # Write each target
-                for (host, port, service), creds in sorted(targets.items()):
-                    f.write("-"*70 + "\n")
-                    f.write(f"Target: {host}:{port}\n")
-                    f.write(f"Service: {service}\n")
-                    f.write(f"Credentials Found: {len(creds)}\n")
-                    f.write("-"*70 + "\n")
-                    
-                    for cred in creds:
-                        f.write(f"  Username: {cred.username}\n")
-                        f.write(f"  Password: {cred.password}\n")
-                        f.write(f"  Found At: {cred.found_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                        f.write(f"  Format: {cred.username}:{cred.password}\n")
-                        f.write("\n")
-                    
-                    f.write("\n")
-                
-                # Footer with combo format
-                f.write("="*70 + "\n")
-                f.write("QUICK COPY FORMAT (username:password)\n")
-                f.write("="*70 + "\n")
-                for cred in credentials:
-                    f.write(f"{cred.username}:{cred.password}\n")
-            
-            logger.info(f"Exported {len(credentials)} credentials to TXT: {filename}")
-            QMessageBox.information(self, "Export", f"Exported {len(credentials)} credentials with full details to {filename}")
-        except Exception as e:
-            logger.error(f"Failed to export TXT: {e}")
-            QMessageBox.critical(self, "Export Error", f"Failed to export TXT:\n{e}")
+        # self.credentials is already grouped by target; snapshot the lists
+        # (not the credentials, which are never mutated) for the worker
+        groups = tuple((key, tuple(creds)) for key, creds in sorted(self.credentials.items()))
+        self._start_export("TXT", _write_txt, filename, groups)
+    
+    def _start_export(self, label: str, writer: Callable, filename: str, data=None) -> None:
+        """
+        Write an export file on the thread pool.
+        
+        The worker gets an immutable snapshot of the column store, so later
+        additions on the GUI thread do not race with the write.
+        
+        Args:
+            label: Format name for messages (CSV, JSON, TXT)
+            writer: Module-level writer function (filename, data)
+            filename: Target file path
+            data: Snapshot to hand to the writer; defaults to the row tuples
+        """
+        if data is None:
+            data = tuple(zip(
+                self._hosts, self._ports, self._services, self._usernames,
+                self._passwords, self._found_at_strs, self._found_at_isos
+            ))
+        
+        task = _ExportTask(label, writer, filename, data, len(self._hosts))
+        task.signals.finished.connect(self._on_export_finished)
+        task.signals.failed.connect(self._on_export_failed)
+        self._export_tasks.add(task)
+        self._set_exporting(True)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_export_finished(self, task: "_ExportTask") -> None:
+        """Report a completed export (GUI thread)."""
+        self._export_tasks.discard(task)
+        self._set_exporting(bool(self._export_tasks))
+        count = task.count
+        details = " with full details" if task.label == "TXT" else ""
+        logger.info(f"Exported {count} credentials to {task.label}: {task.filename}")
+        QMessageBox.information(self, "Export", f"Exported {count} credentials{details} to {task.filename}")
+    
+    def _on_export_failed(self, task: "_ExportTask", error: str) -> None:
+        """Report a failed export (GUI thread)."""
+        self._export_tasks.discard(task)
+        self._set_exporting(bool(self._export_tasks))
+        logger.error(f"Failed to export {task.label}: {error}")
+        QMessageBox.critical(self, "Export Error", f"Failed to export {task.label}:\n{error}")
+    
+    def _set_exporting(self, busy: bool) -> None:
+        """Disable export buttons while an export is running."""
+        for button in (self.export_csv_btn, self.export_json_btn, self.export_txt_btn):
+            button.setEnabled(not busy)
     
     def _update_stats(self) -> None:
         """Update statistics label."""
+        # Both counts are O(1): one column entry per credential, one dict
+        # key per target
         total_targets = len(self.credentials)
-        total_creds = sum(len(creds) for creds in self.credentials.values())
+        total_creds = len(self._hosts)
         
         if total_creds == 0:
             self.stats_label.setText("No credentials found yet")
@@ -454,3 +676,148 @@ class ResultsWidget(QWidget):
                 f"Total: {total_creds} credential{'s' if total_creds != 1 else ''} "
                 f"across {total_targets} target{'s' if total_targets != 1 else ''}"
             )
+
+
+# === Export writers (run on QThreadPool) ===
+#
+# Rows are (host, port, service, username, password, found_at_str,
+# found_at_iso) tuples snapshotted on the GUI thread.
+
+_EXPORT_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer: fewer syscalls on large exports
+_csv_fields = itemgetter(0, 1, 2, 3, 4, 5)  # Row -> CSV record (C-level projection)
+
+
+@contextmanager
+def _atomic_open(filename: str, mode: str = 'w', **kwargs):
+    """
+    Open a sibling temp file and move it over filename once writing succeeds.
+    
+    A failed or interrupted export leaves any previous file intact instead
+    of truncating it.
+    """
+    tmp = filename + ".tmp"
+    try:
+        with open(tmp, mode, buffering=_EXPORT_BUFFER_SIZE, **kwargs) as f:
+            yield f
+        os.replace(tmp, filename)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _write_csv(filename: str, rows: Tuple[tuple, ...]) -> None:
+    """Write credential rows as CSV."""
+    with _atomic_open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Host", "Port", "Service", "Username", "Password", "Found At"])
+        writer.writerows(map(_csv_fields, rows))
+
+
+def _write_json(filename: str, rows: Tuple[tuple, ...]) -> None:
+    """Write credential rows as JSON."""
+    if ORJSON_AVAILABLE:
+        data = [
+            {
+                "host": host,
+                "port": port,
+                "service": service,
+                "username": username,
+                "password": password,
+                "found_at": found_at
+            }
+            for host, port, service, username, password, _, found_at in rows
+        ]
+        with _atomic_open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    # Stdlib fallback: stream one object at a time instead of building the whole list;
+    # the output matches json.dump(list, indent=2)
+    encode = json.JSONEncoder(indent=2).encode
+    with _atomic_open(filename, 'w', encoding='utf-8') as f:
+        f.write("[")
+        separator = "\n  "
+        for host, port, service, username, password, _, found_at in rows:
+            f.write(separator)
+            f.write(encode({
+                "host": host,
+                "port": port,
+                "service": service,
+                "username": username,
+                "password": password,
+                "found_at": found_at
+            }).replace("\n", "\n  "))
+            separator = ",\n  "
+        f.write("]" if separator == "\n  " else "\n]")
+
+
+def _write_txt(filename: str, groups: Tuple[Tuple[tuple, Tuple[CredentialResult, ...]], ...]) -> None:
+    """Write credentials, already grouped and sorted by target, as a human-readable report."""
+    total = sum(len(creds) for _, creds in groups)
+    with _atomic_open(filename, 'w', encoding='utf-8') as f:
+        # Header
+        f.write("="*70 + "\n")
+        f.write("LEGION HYDRA SCAN RESULTS\n")
+        f.write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Total Credentials Found: {total}\n")
+        f.write("="*70 + "\n\n")
+        
+        # user:pass is needed per credential and again in the footer; build once
+        combos = []
+        
+        # Write each target
+        for (host, port, service), creds in groups:
+            f.write("-"*70 + "\n")
+            f.write(f"Target: {host}:{port}\n")
+            f.write(f"Service: {service}\n")
+            f.write(f"Credentials Found: {len(creds)}\n")
+            f.write("-"*70 + "\n")
+            
+            for cred in creds:
+                combo = f"{cred.username}:{cred.password}"
+                combos.append(combo)
+                f.write(f"  Username: {cred.username}\n")
+                f.write(f"  Password: {cred.password}\n")
+                f.write(f"  Found At: {cred.found_at_str}\n")
+                f.write(f"  Format: {combo}\n")
+                f.write("\n")
+            
+            f.write("\n")
+        
+        # Footer with combo format
+        f.write("="*70 + "\n")
+        f.write("QUICK COPY FORMAT (username:password)\n")
+        f.write("="*70 + "\n")
+        if combos:
+            f.write("\n".join(combos))
+            f.write("\n")
+
+
+class _ExportSignals(QObject):
+    """Signals for _ExportTask (QRunnable is not a QObject)."""
+    
+    finished = pyqtSignal(object)  # _ExportTask
+    failed = pyqtSignal(object, str)  # _ExportTask, error message
+
+
+class _ExportTask(QRunnable):
+    """Runs an export writer on the thread pool."""
+    
+    def __init__(self, label: str, writer: Callable, filename: str, data: tuple, count: int):
+        super().__init__()
+        self.label = label
+        self.writer = writer
+        self.filename = filename
+        self.data = data
+        self.count = count
+        self.signals = _ExportSignals()
+        # ResultsWidget keeps the Python reference until the result arrives
+        self.setAutoDelete(False)
+    
+    def run(self) -> None:
+        try:
+            self.writer(self.filename, self.data)
+        except Exception as e:
+            self.signals.failed.emit(self, str(e))
+        else:
+            self.signals.finished.emit(self)
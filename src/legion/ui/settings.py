@@ -7,17 +7,24 @@ Author: Gotham Security
 Date: 2025-11-12
 """
 
+import copy
 import logging
+import pickle
+import platform
+from dataclasses import asdict
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
     QWidget, QLabel, QLineEdit, QSpinBox, QCheckBox,
     QComboBox, QPushButton, QFileDialog, QGroupBox,
-    QFormLayout, QMessageBox, QTextEdit
+    QFormLayout, QMessageBox, QPlainTextEdit, QDialogButtonBox, QDoubleSpinBox
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, QRunnable, QSignalBlocker, QStringListModel, QThreadPool, QTimer
 )
-from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from legion.config.manager import ConfigManager
@@ -25,6 +32,138 @@ from legion.config.schema import LegionConfig
 
 logger = logging.getLogger(__name__)
 
+# Probed once per process rather than on every dialog open
+_IS_WINDOWS = platform.system() == "Windows"
+_TERMINALS = ("cmd", "powershell", "wt") if _IS_WINDOWS else ("gnome-terminal", "xterm", "konsole", "terminator")
+
+# Combo box choices
+_THEMES = ("system", "light", "dark")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_SCAN_PROFILES = ("quick", "full", "stealth", "version", "os", "aggressive")
+
+_TOOL_FILTER = "Executables (*.exe);;All Files (*.*)"
+
+# Nmap -T templates; the combo index is the template number
+_TIMING_TEMPLATES = (
+    "0 - Paranoid (slowest)",
+    "1 - Sneaky",
+    "2 - Polite",
+    "3 - Normal",
+    "4 - Aggressive (default)",
+    "5 - Insane (fastest)",
+)
+
+
+class _Binding(NamedTuple):
+    """Maps one widget to one config field."""
+    
+    widget: str  # SettingsDialog attribute
+    setter: str  # Widget method that takes the config value
+    getter: str  # Widget method that returns the value to store
+    section: str  # LegionConfig attribute (ui, scanning, ...)
+    field: str  # Attribute on that section
+    nullable: bool = False  # Optional[str]: None <-> empty text
+
+
+_GENERAL_BINDINGS = (
+    _Binding("theme_combo", "setCurrentText", "currentText", "ui", "theme"),
+    _Binding("font_size_spin", "setValue", "value", "ui", "font_size"),
+    _Binding("show_toolbar_check", "setChecked", "isChecked", "ui", "show_toolbar"),
+    _Binding("show_statusbar_check", "setChecked", "isChecked", "ui", "show_statusbar"),
+    _Binding("auto_refresh_spin", "setValue", "value", "ui", "auto_refresh_interval"),
+    _Binding("terminal_combo", "setCurrentText", "currentText", "ui", "default_terminal"),
+    _Binding("log_level_combo", "setCurrentText", "currentText", "logging", "level"),
+    _Binding("log_file_check", "setChecked", "isChecked", "logging", "file_enabled"),
+    _Binding("log_console_check", "setChecked", "isChecked", "logging", "console_enabled"),
+)
+
+_SCANNING_BINDINGS = (
+    _Binding("scan_profile_combo", "setCurrentText", "currentText", "scanning", "default_profile"),
+    _Binding("scan_timeout_spin", "setValue", "value", "scanning", "timeout"),
+    _Binding("max_concurrent_spin", "setValue", "value", "scanning", "max_concurrent"),
+    _Binding("timing_combo", "setCurrentIndex", "currentIndex", "scanning", "timing_template"),
+    _Binding("screenshot_timeout_spin", "setValue", "value", "scanning", "screenshot_timeout"),
+    _Binding("web_services_edit", "setText", "text", "scanning", "web_services"),
+    _Binding("auto_parse_check", "setChecked", "isChecked", "scanning", "auto_parse"),
+    _Binding("auto_save_check", "setChecked", "isChecked", "scanning", "auto_save"),
+    _Binding("verbose_check", "setChecked", "isChecked", "scanning", "verbose_output"),
+)
+
+_TOOLS_BINDINGS = (
+    _Binding("nmap_path_edit", "setText", "text", "tools", "nmap_path", nullable=True),
+    _Binding("hydra_path_edit", "setText", "text", "tools", "hydra_path", nullable=True),
+    _Binding("nikto_path_edit", "setText", "text", "tools", "nikto_path", nullable=True),
+    _Binding("searchsploit_path_edit", "setText", "text", "tools", "searchsploit_path", nullable=True),
+    _Binding("cache_enabled_check", "setChecked", "isChecked", "tools", "cache_enabled"),
+    _Binding("cache_ttl_spin", "setValue", "value", "tools", "cache_ttl"),
+    # NSE Scripts
+    _Binding("nse_script_path_edit", "setText", "text", "scanning", "nse_script_path", nullable=True),
+    _Binding("enable_nse_check", "setChecked", "isChecked", "scanning", "enable_nse_scripts"),
+    _Binding("enable_vulners_check", "setChecked", "isChecked", "scanning", "enable_vulners"),
+    _Binding("vulners_min_cvss_spin", "setValue", "value", "scanning", "vulners_min_cvss"),
+    _Binding("shodan_api_key_edit", "setText", "text", "scanning", "shodan_api_key"),
+    # Hydra
+    _Binding("hydra_tasks_spin", "setValue", "value", "tools", "hydra_default_tasks"),
+    _Binding("hydra_timeout_spin", "setValue", "value", "tools", "hydra_default_timeout"),
+    _Binding("hydra_wordlist_edit", "setText", "text", "tools", "hydra_wordlist_path", nullable=True),
+)
+
+
+def _form_layout() -> QFormLayout:
+    """
+    Create a form layout with fixed policies and spacing.
+    
+    Setting these explicitly spares Qt the per-row style queries and the
+    label wrap measurement pass.
+    """
+    form = QFormLayout()
+    form.setRowWrapPolicy(QFormLayout.RowWrapPolicy.DontWrapRows)
+    form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
+    form.setHorizontalSpacing(8)
+    form.setVerticalSpacing(4)
+    return form
+
+
+class PathPicker(QWidget):
+    """Line edit with a Browse... button for a file or directory path."""
+    
+    def __init__(
+        self,
+        browse: Callable[[QLineEdit, bool], None],
+        is_directory: bool = False,
+        parent: Optional[QWidget] = None
+    ):
+        """
+        Initialize path picker.
+        
+        Args:
+            browse: Called with (line_edit, is_directory) when Browse is clicked
+            is_directory: Pick a directory instead of a file
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        
+        self.line_edit = QLineEdit()
+        browse_button = QPushButton("Browse...")
+        browse_button.clicked.connect(partial(browse, self.line_edit, is_directory))
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.line_edit)
+        layout.addWidget(browse_button)
+    
+    def text(self) -> str:
+        """Return the current path."""
+        return self.line_edit.text()
+    
+    def setText(self, text: str) -> None:
+        """Set the current path."""
+        self.line_edit.setText(text)
+    
+    def setPlaceholderText(self, text: str) -> None:
+        """Set the hint shown while the path is empty."""
+        self.line_edit.setPlaceholderText(text)
+
 
 class SettingsDialog(QDialog):
     """
@@ -37,10 +176,14 @@ class SettingsDialog(QDialog):
     - Advanced: TOML editor for manual editing
     
     Signals:
-        settings_changed: Emitted when settings are applied
+        settings_changed: Emitted with the saved LegionConfig when settings
+            are applied
     """
     
-    settings_changed = pyqtSignal()
+    settings_changed = pyqtSignal(object)
+    
+    # TOML editor font, shared across dialog opens (font matching is slow)
+    _MONO_FONT: Optional[QFont] = None
     
     def __init__(
         self,
@@ -58,13 +201,30 @@ class SettingsDialog(QDialog):
         
         self.config_manager = config_manager
         self.config = config_manager.load()
-        self._original_config = self.config  # For reset
+        # Snapshot of the config as opened, for "Revert Changes" (the dialog
+        # edits self.config in place, so a plain reference would drift)
+        self._original_blob = pickle.dumps(self.config, protocol=pickle.HIGHEST_PROTOCOL)
+        # Config state as last loaded/saved; Apply/Save skip the write when unchanged
+        self._clean_state = asdict(self.config)
+        self._save_jobs: set["_SaveJob"] = set()
+        # Saved config waiting to be emitted (None when nothing is pending)
+        self._pending_config: Optional[LegionConfig] = None
+        # Set once the dialog is closed; it deletes itself when also idle
+        self._closed = False
+        
+        # Browse dialogs, created on first use and reused afterwards
+        self._file_dlg: Optional[QFileDialog] = None
+        self._dir_dlg: Optional[QFileDialog] = None
         
         self.setWindowTitle("Legion Settings")
         self.setMinimumSize(600, 500)
         
         self._init_ui()
-        self._load_values()
+        
+        # Let the dialog paint first and fill in values on the next event
+        # loop tick; disabled until then so nothing is saved from blank widgets
+        self.setEnabled(False)
+        QTimer.singleShot(0, self._load_values)
     
     def _init_ui(self) -> None:
         """Initialize UI components."""
@@ -74,47 +234,71 @@ class SettingsDialog(QDialog):
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
         
-        # Create tabs
-        self._create_general_tab()
-        self._create_scanning_tab()
-        self._create_tools_tab()
-        self._create_advanced_tab()
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        self.reset_button = QPushButton("Reset to Defaults")
+        # Tabs start as empty placeholders and are built and populated on
+        # first visit; most opens only ever show the first one
+        self._tab_builders = [
+            ("General", self._create_general_tab, self._load_general, self._save_general),
+            ("Scanning", self._create_scanning_tab, self._load_scanning, self._save_scanning),
+            ("Tools", self._create_tools_tab, self._load_tools, self._save_tools),
+            ("Advanced", self._create_advanced_tab, self._reload_toml, None),
+        ]
+        self._built_tabs: set[int] = set()
+        for title, _, _, _ in self._tab_builders:
+            self.tabs.addTab(QWidget(), title)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tabs.currentIndex(), load=False)
+        
+        # Buttons (platform order; Enter saves, Esc cancels)
+        Button = QDialogButtonBox.StandardButton
+        button_box = QDialogButtonBox(Button.Reset | Button.Cancel | Button.Apply | Button.Save)
+        button_box.accepted.connect(self._on_save)
+        button_box.rejected.connect(self.reject)
+        
+        self.reset_button = button_box.button(Button.Reset)
+        self.reset_button.setText("Reset...")
         self.reset_button.clicked.connect(self._on_reset)
-        button_layout.addWidget(self.reset_button)
-        
-        button_layout.addStretch()
+        self.cancel_button = button_box.button(Button.Cancel)
+        self.apply_button = button_box.button(Button.Apply)
+        self.apply_button.clicked.connect(self._on_apply)
+        self.save_button = button_box.button(Button.Save)
+        self.save_button.setDefault(True)
         
-        self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.clicked.connect(self.reject)
-        button_layout.addWidget(self.cancel_button)
+        layout.addWidget(button_box)
+    
+    def _ensure_tab_built(self, index: int, load: bool = True) -> None:
+        """
+        Build and populate a tab the first time it is shown.
         
-        self.apply_button = QPushButton("Apply")
-        self.apply_button.clicked.connect(self._on_apply)
-        button_layout.addWidget(self.apply_button)
+        Args:
+            index: Tab index
+            load: Populate from the config right away (the first tab is
+                populated by the deferred _load_values instead)
+        """
+        if index < 0 or index in self._built_tabs:
+            return
         
-        self.save_button = QPushButton("Save")
-        self.save_button.clicked.connect(self._on_save)
-        self.save_button.setDefault(True)
-        button_layout.addWidget(self.save_button)
+        _, builder, loader, _ = self._tab_builders[index]
         
-        layout.addLayout(button_layout)
+        # Build and populate with repaints off so the tab appears in one go
+        self.setUpdatesEnabled(False)
+        try:
+            builder(self.tabs.widget(index))
+            self._built_tabs.add(index)
+            if load:
+                loader()
+        finally:
+            self.setUpdatesEnabled(True)
     
-    def _create_general_tab(self) -> None:
+    def _create_general_tab(self, tab: QWidget) -> None:
         """Create General settings tab."""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # UI Settings
         ui_group = QGroupBox("User Interface")
-        ui_layout = QFormLayout()
+        ui_layout = _form_layout()
         
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["system", "light", "dark"])
+        self.theme_combo.addItems(_THEMES)
         self.theme_combo.currentTextChanged.connect(self._on_theme_changed)
         ui_layout.addRow("Theme:", self.theme_combo)
         
@@ -137,11 +321,7 @@ class SettingsDialog(QDialog):
         
         # Terminal Selection (Legacy feature)
         self.terminal_combo = QComboBox()
-        import platform
-        if platform.system() == "Windows":
-            self.terminal_combo.addItems(["cmd", "powershell", "wt"])
-        else:
-            self.terminal_combo.addItems(["gnome-terminal", "xterm", "konsole", "terminator"])
+        self.terminal_combo.addItems(_TERMINALS)
         ui_layout.addRow("Default Terminal:", self.terminal_combo)
         
         ui_group.setLayout(ui_layout)
@@ -149,10 +329,10 @@ class SettingsDialog(QDialog):
         
         # Logging Settings
         log_group = QGroupBox("Logging")
-        log_layout = QFormLayout()
+        log_layout = _form_layout()
         
         self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+        self.log_level_combo.addItems(_LOG_LEVELS)
         log_layout.addRow("Log Level:", self.log_level_combo)
         
         self.log_file_check = QCheckBox("Enable File Logging")
@@ -165,19 +345,17 @@ class SettingsDialog(QDialog):
         layout.addWidget(log_group)
         
         layout.addStretch()
-        self.tabs.addTab(tab, "General")
     
-    def _create_scanning_tab(self) -> None:
+    def _create_scanning_tab(self, tab: QWidget) -> None:
         """Create Scanning settings tab."""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Scan Defaults
         scan_group = QGroupBox("Scan Defaults")
-        scan_layout = QFormLayout()
+        scan_layout = _form_layout()
         
         self.scan_profile_combo = QComboBox()
-        self.scan_profile_combo.addItems(["quick", "full", "stealth", "version", "os", "aggressive"])
+        self.scan_profile_combo.addItems(_SCAN_PROFILES)
         scan_layout.addRow("Default Profile:", self.scan_profile_combo)
         
         self.scan_timeout_spin = QSpinBox()
@@ -190,14 +368,8 @@ class SettingsDialog(QDialog):
         scan_layout.addRow("Max Concurrent Scans:", self.max_concurrent_spin)
         
         self.timing_combo = QComboBox()
-        self.timing_combo.addItems([
-            "0 - Paranoid (slowest)",
-            "1 - Sneaky",
-            "2 - Polite",
-            "3 - Normal",
-            "4 - Aggressive (default)",
-            "5 - Insane (fastest)"
-        ])
+        # One model reset instead of an insert per item
+        self.timing_combo.setModel(QStringListModel(list(_TIMING_TEMPLATES), self.timing_combo))
         scan_layout.addRow("Timing Template:", self.timing_combo)
         
         # Screenshot Timeout (Legacy feature)
@@ -233,52 +405,34 @@ class SettingsDialog(QDialog):
         layout.addWidget(options_group)
         
         layout.addStretch()
-        self.tabs.addTab(tab, "Scanning")
     
-    def _create_tools_tab(self) -> None:
+    def _create_tools_tab(self, tab: QWidget) -> None:
         """Create Tools settings tab."""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         tools_group = QGroupBox("Tool Paths")
-        tools_layout = QFormLayout()
-        
-        # Helper to create path input with browse button
-        def create_path_input(label: str, is_directory: bool = False) -> tuple[QLineEdit, QPushButton]:
-            h_layout = QHBoxLayout()
-            line_edit = QLineEdit()
-            browse_btn = QPushButton("Browse...")
-            browse_btn.clicked.connect(
-                lambda: self._browse_for_tool(line_edit, is_directory)
-            )
-            h_layout.addWidget(line_edit)
-            h_layout.addWidget(browse_btn)
-            tools_layout.addRow(label, h_layout)
-            return line_edit, browse_btn
+        tools_layout = _form_layout()
         
-        self.nmap_path_edit, _ = create_path_input("nmap:")
-        self.hydra_path_edit, _ = create_path_input("hydra:")
-        self.nikto_path_edit, _ = create_path_input("nikto:")
-        self.searchsploit_path_edit, _ = create_path_input("searchsploit:")
+        self.nmap_path_edit = PathPicker(self._browse_for_tool)
+        tools_layout.addRow("nmap:", self.nmap_path_edit)
+        self.hydra_path_edit = PathPicker(self._browse_for_tool)
+        tools_layout.addRow("hydra:", self.hydra_path_edit)
+        self.nikto_path_edit = PathPicker(self._browse_for_tool)
+        tools_layout.addRow("nikto:", self.nikto_path_edit)
+        self.searchsploit_path_edit = PathPicker(self._browse_for_tool)
+        tools_layout.addRow("searchsploit:", self.searchsploit_path_edit)
         
         tools_group.setLayout(tools_layout)
         layout.addWidget(tools_group)
         
         # NSE Scripts Settings
         nse_group = QGroupBox("Nmap NSE Scripts")
-        nse_layout = QFormLayout()
+        nse_layout = _form_layout()
         
         # NSE script path
-        nse_path_layout = QHBoxLayout()
-        self.nse_script_path_edit = QLineEdit()
+        self.nse_script_path_edit = PathPicker(self._browse_for_tool, is_directory=True)
         self.nse_script_path_edit.setPlaceholderText("Leave empty to use Legion's scripts/nmap/")
-        nse_browse_btn = QPushButton("Browse...")
-        nse_browse_btn.clicked.connect(
-            lambda: self._browse_for_tool(self.nse_script_path_edit, is_directory=True)
-        )
-        nse_path_layout.addWidget(self.nse_script_path_edit)
-        nse_path_layout.addWidget(nse_browse_btn)
-        nse_layout.addRow("NSE Scripts Path:", nse_path_layout)
+        nse_layout.addRow("NSE Scripts Path:", self.nse_script_path_edit)
         
         # Enable NSE
         self.enable_nse_check = QCheckBox("Enable Nmap NSE Scripts")
@@ -288,9 +442,10 @@ class SettingsDialog(QDialog):
         self.enable_vulners_check = QCheckBox("Auto-run Vulners CVE scan")
         nse_layout.addRow("", self.enable_vulners_check)
         
-        self.vulners_min_cvss_spin = QSpinBox()
-        self.vulners_min_cvss_spin.setRange(0, 10)
-        self.vulners_min_cvss_spin.setSingleStep(1)
+        self.vulners_min_cvss_spin = QDoubleSpinBox()
+        self.vulners_min_cvss_spin.setRange(0.0, 10.0)
+        self.vulners_min_cvss_spin.setSingleStep(0.1)
+        self.vulners_min_cvss_spin.setDecimals(1)
         self.vulners_min_cvss_spin.setSuffix(" (0 = all)")
         nse_layout.addRow("Min CVSS Score:", self.vulners_min_cvss_spin)
         
@@ -305,7 +460,7 @@ class SettingsDialog(QDialog):
         
         # Hydra Settings
         hydra_group = QGroupBox("Hydra Brute Force")
-        hydra_layout = QFormLayout()
+        hydra_layout = _form_layout()
         
         # Default tasks
         self.hydra_tasks_spin = QSpinBox()
@@ -322,23 +477,16 @@ class SettingsDialog(QDialog):
         hydra_layout.addRow("Default Timeout:", self.hydra_timeout_spin)
         
         # Wordlist path
-        hydra_wordlist_layout = QHBoxLayout()
-        self.hydra_wordlist_edit = QLineEdit()
+        self.hydra_wordlist_edit = PathPicker(self._browse_for_tool, is_directory=True)
         self.hydra_wordlist_edit.setPlaceholderText("Leave empty to use scripts/wordlists/")
-        hydra_wordlist_browse = QPushButton("Browse...")
-        hydra_wordlist_browse.clicked.connect(
-            lambda: self._browse_for_tool(self.hydra_wordlist_edit, is_directory=True)
-        )
-        hydra_wordlist_layout.addWidget(self.hydra_wordlist_edit)
-        hydra_wordlist_layout.addWidget(hydra_wordlist_browse)
-        hydra_layout.addRow("Wordlist Directory:", hydra_wordlist_layout)
+        hydra_layout.addRow("Wordlist Directory:", self.hydra_wordlist_edit)
         
         hydra_group.setLayout(hydra_layout)
         layout.addWidget(hydra_group)
         
         # Tool Cache Settings
         cache_group = QGroupBox("Tool Discovery")
-        cache_layout = QFormLayout()
+        cache_layout = _form_layout()
         
         self.cache_enabled_check = QCheckBox("Enable tool cache")
         cache_layout.addRow("", self.cache_enabled_check)
@@ -352,11 +500,9 @@ class SettingsDialog(QDialog):
         layout.addWidget(cache_group)
         
         layout.addStretch()
-        self.tabs.addTab(tab, "Tools")
     
-    def _create_advanced_tab(self) -> None:
+    def _create_advanced_tab(self, tab: QWidget) -> None:
         """Create Advanced settings tab (TOML editor)."""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         info_label = QLabel(
@@ -366,112 +512,90 @@ class SettingsDialog(QDialog):
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
         
-        self.toml_editor = QTextEdit()
-        self.toml_editor.setFont(QFont("Courier", 9))
+        self.toml_editor = QPlainTextEdit()
+        self.toml_editor.setFont(self._mono_font())
+        self.toml_editor.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         layout.addWidget(self.toml_editor)
         
         reload_btn = QPushButton("Reload from File")
         reload_btn.clicked.connect(self._reload_toml)
         layout.addWidget(reload_btn)
-        
-        self.tabs.addTab(tab, "Advanced")
+    
+    @classmethod
+    def _mono_font(cls) -> QFont:
+        """Return the shared monospace font, creating it on first use."""
+        if cls._MONO_FONT is None:
+            font = QFont("Courier", 9)
+            font.setStyleHint(QFont.StyleHint.Monospace)
+            cls._MONO_FONT = font
+        return cls._MONO_FONT
     
     def _load_values(self) -> None:
-        """Load current config values into UI."""
-        # General
-        self.theme_combo.setCurrentText(self.config.ui.theme)
-        self.font_size_spin.setValue(self.config.ui.font_size)
-        self.show_toolbar_check.setChecked(self.config.ui.show_toolbar)
-        self.show_statusbar_check.setChecked(self.config.ui.show_statusbar)
-        self.auto_refresh_spin.setValue(self.config.ui.auto_refresh_interval)
-        self.terminal_combo.setCurrentText(self.config.ui.default_terminal)
-        
-        self.log_level_combo.setCurrentText(self.config.logging.level)
-        self.log_file_check.setChecked(self.config.logging.file_enabled)
-        self.log_console_check.setChecked(self.config.logging.console_enabled)
-        
-        # Scanning
-        self.scan_profile_combo.setCurrentText(self.config.scanning.default_profile)
-        self.scan_timeout_spin.setValue(self.config.scanning.timeout)
-        self.max_concurrent_spin.setValue(self.config.scanning.max_concurrent)
-        self.timing_combo.setCurrentIndex(self.config.scanning.timing_template)
-        self.screenshot_timeout_spin.setValue(self.config.scanning.screenshot_timeout)
-        self.web_services_edit.setText(self.config.scanning.web_services)
-        
-        self.auto_parse_check.setChecked(self.config.scanning.auto_parse)
-        self.auto_save_check.setChecked(self.config.scanning.auto_save)
-        self.verbose_check.setChecked(self.config.scanning.verbose_output)
-        
-        # Tools
-        self.nmap_path_edit.setText(self.config.tools.nmap_path or "")
-        self.hydra_path_edit.setText(self.config.tools.hydra_path or "")
-        self.nikto_path_edit.setText(self.config.tools.nikto_path or "")
-        self.searchsploit_path_edit.setText(self.config.tools.searchsploit_path or "")
-        
-        self.cache_enabled_check.setChecked(self.config.tools.cache_enabled)
-        self.cache_ttl_spin.setValue(self.config.tools.cache_ttl)
-        
-        # NSE Scripts
-        self.nse_script_path_edit.setText(self.config.scanning.nse_script_path or "")
-        self.enable_nse_check.setChecked(self.config.scanning.enable_nse_scripts)
-        self.enable_vulners_check.setChecked(self.config.scanning.enable_vulners)
-        self.vulners_min_cvss_spin.setValue(int(self.config.scanning.vulners_min_cvss))
-        self.shodan_api_key_edit.setText(self.config.scanning.shodan_api_key or "")
-        
-        # Hydra
-        self.hydra_tasks_spin.setValue(self.config.tools.hydra_default_tasks)
-        self.hydra_timeout_spin.setValue(self.config.tools.hydra_default_timeout)
-        self.hydra_wordlist_edit.setText(self.config.tools.hydra_wordlist_path or "")
-        
-        # Advanced (TOML)
-        self._reload_toml()
+        """Load current config values into the tabs built so far."""
+        for index in sorted(self._built_tabs):
+            self._tab_builders[index][2]()
+        self.setEnabled(True)
+    
+    def _load_bindings(self, bindings: tuple[_Binding, ...]) -> None:
+        """
+        Copy config values into widgets.
+        
+        Args:
+            bindings: Widget/field pairs to load
+        """
+        config = self.config
+        for b in bindings:
+            value = getattr(getattr(config, b.section), b.field)
+            if b.nullable and value is None:
+                value = ""
+            getattr(getattr(self, b.widget), b.setter)(value)
+    
+    def _load_general(self) -> None:
+        """Load General tab values."""
+        # Loading is not a user theme change; keep the preview slot quiet
+        with QSignalBlocker(self.theme_combo):
+            self._load_bindings(_GENERAL_BINDINGS)
+    
+    def _load_scanning(self) -> None:
+        """Load Scanning tab values."""
+        self._load_bindings(_SCANNING_BINDINGS)
+    
+    def _load_tools(self) -> None:
+        """Load Tools tab values."""
+        self._load_bindings(_TOOLS_BINDINGS)
     
     def _save_values(self) -> None:
-        """Save UI values to config object."""
-        # General
-        self.config.ui.theme = self.theme_combo.currentText()
-        self.config.ui.font_size = self.font_size_spin.value()
-        self.config.ui.show_toolbar = self.show_toolbar_check.isChecked()
-        self.config.ui.show_statusbar = self.show_statusbar_check.isChecked()
-        self.config.ui.auto_refresh_interval = self.auto_refresh_spin.value()
-        self.config.ui.default_terminal = self.terminal_combo.currentText()
-        
-        self.config.logging.level = self.log_level_combo.currentText()
-        self.config.logging.file_enabled = self.log_file_check.isChecked()
-        self.config.logging.console_enabled = self.log_console_check.isChecked()
-        
-        # Scanning
-        self.config.scanning.default_profile = self.scan_profile_combo.currentText()
-        self.config.scanning.timeout = self.scan_timeout_spin.value()
-        self.config.scanning.max_concurrent = self.max_concurrent_spin.value()
-        self.config.scanning.timing_template = self.timing_combo.currentIndex()
-        self.config.scanning.screenshot_timeout = self.screenshot_timeout_spin.value()
-        self.config.scanning.web_services = self.web_services_edit.text()
-        
-        self.config.scanning.auto_parse = self.auto_parse_check.isChecked()
-        self.config.scanning.auto_save = self.auto_save_check.isChecked()
-        self.config.scanning.verbose_output = self.verbose_check.isChecked()
-        
-        # Tools
-        self.config.tools.nmap_path = self.nmap_path_edit.text() or None
-        self.config.tools.hydra_path = self.hydra_path_edit.text() or None
-        self.config.tools.nikto_path = self.nikto_path_edit.text() or None
-        self.config.tools.searchsploit_path = self.searchsploit_path_edit.text() or None
-        
-        self.config.tools.cache_enabled = self.cache_enabled_check.isChecked()
-        self.config.tools.cache_ttl = self.cache_ttl_spin.value()
-        
-        # NSE Scripts
-        self.config.scanning.nse_script_path = self.nse_script_path_edit.text() or None
-        self.config.scanning.enable_nse_scripts = self.enable_nse_check.isChecked()
-        self.config.scanning.enable_vulners = self.enable_vulners_check.isChecked()
-        self.config.scanning.vulners_min_cvss = float(self.vulners_min_cvss_spin.value())
-        self.config.scanning.shodan_api_key = self.shodan_api_key_edit.text() or ""
-        
-        # Hydra
-        self.config.tools.hydra_default_tasks = self.hydra_tasks_spin.value()
-        self.config.tools.hydra_default_timeout = self.hydra_timeout_spin.value()
-        self.config.tools.hydra_wordlist_path = self.hydra_wordlist_edit.text() or None
+        """Save UI values to config object (unbuilt tabs keep their config values)."""
+        for index in sorted(self._built_tabs):
+            saver = self._tab_builders[index][3]
+            if saver is not None:
+                saver()
+    
+    def _save_bindings(self, bindings: tuple[_Binding, ...]) -> None:
+        """
+        Copy widget values into the config.
+        
+        Args:
+            bindings: Widget/field pairs to save
+        """
+        config = self.config
+        for b in bindings:
+            value = getattr(getattr(self, b.widget), b.getter)()
+            if b.nullable:
+                value = value or None
+            setattr(getattr(config, b.section), b.field, value)
+    
+    def _save_general(self) -> None:
+        """Save General tab values."""
+        self._save_bindings(_GENERAL_BINDINGS)
+    
+    def _save_scanning(self) -> None:
+        """Save Scanning tab values."""
+        self._save_bindings(_SCANNING_BINDINGS)
+    
+    def _save_tools(self) -> None:
+        """Save Tools tab values."""
+        self._save_bindings(_TOOLS_BINDINGS)
     
     def _browse_for_tool(self, line_edit: QLineEdit, is_directory: bool = False) -> None:
         """
@@ -482,32 +606,36 @@ class SettingsDialog(QDialog):
             is_directory: If True, select directory instead of file
         """
         if is_directory:
-            dir_path = QFileDialog.getExistingDirectory(
-                self,
-                "Select Directory",
-                ""
-            )
-            if dir_path:
-                line_edit.setText(dir_path)
+            if self._dir_dlg is None:
+                self._dir_dlg = QFileDialog(self, "Select Directory", "")
+                self._dir_dlg.setFileMode(QFileDialog.FileMode.Directory)
+                self._dir_dlg.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            dialog = self._dir_dlg
         else:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "Select Tool Executable",
-                "",
-                "Executables (*.exe);;All Files (*.*)"
-            )
-            
-            if file_path:
-                line_edit.setText(file_path)
+            if self._file_dlg is None:
+                self._file_dlg = QFileDialog(self, "Select Tool Executable", "")
+                self._file_dlg.setFileMode(QFileDialog.FileMode.ExistingFile)
+                self._file_dlg.setNameFilter(_TOOL_FILTER)
+            dialog = self._file_dlg
+        
+        # Start next to the current path rather than in the (possibly huge)
+        # default directory; otherwise the dialog keeps its last location
+        current = line_edit.text().strip()
+        if current:
+            start = Path(current) if is_directory else Path(current).parent
+            if start.is_dir():
+                dialog.setDirectory(str(start))
+        
+        if dialog.exec() and dialog.selectedFiles():
+            line_edit.setText(dialog.selectedFiles()[0])
     
     def _reload_toml(self) -> None:
         """Reload TOML content from file."""
         try:
-            with open(self.config_manager.config_path, 'r') as f:
-                toml_content = f.read()
+            toml_content = Path(self.config_manager.config_path).read_text(encoding='utf-8')
             self.toml_editor.setPlainText(toml_content)
         except Exception as e:
-            logger.error(f"Failed to load TOML: {e}")
+            logger.error("Failed to load TOML: %s", e)
             self.toml_editor.setPlainText(f"# Error loading TOML: {e}")
     
     def _on_theme_changed(self, theme: str) -> None:
@@ -518,75 +646,166 @@ class SettingsDialog(QDialog):
             theme: Selected theme
         """
         # TODO: Apply theme preview
-        logger.info(f"Theme changed to: {theme}")
+        logger.info("Theme changed to: %s", theme)
+    
+    def _is_dirty(self) -> bool:
+        """Check whether the config differs from what was last loaded or saved."""
+        return asdict(self.config) != self._clean_state
     
     def _on_apply(self) -> None:
         """Apply settings without closing dialog."""
         self._save_values()
+        if not self._is_dirty():
+            logger.debug("Settings unchanged, nothing to apply")
+            return
         
-        try:
-            # Validate
-            self.config.validate()
-            
-            # Save to file
-            self.config_manager.save(self.config)
-            
-            # Emit signal
-            self.settings_changed.emit()
-            
-            logger.info("Settings applied successfully")
-            
-            QMessageBox.information(
-                self,
-                "Settings Applied",
-                "Settings have been applied successfully."
-            )
-            
-        except Exception as e:
-            logger.error(f"Failed to apply settings: {e}")
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to apply settings:\n{e}"
-            )
+        self._start_save(close=False)
     
     def _on_save(self) -> None:
         """Save settings and close dialog."""
         self._save_values()
+        if not self._is_dirty():
+            self.accept()
+            return
         
-        try:
-            # Validate
-            self.config.validate()
-            
-            # Save to file
-            self.config_manager.save(self.config)
-            
-            # Emit signal
-            self.settings_changed.emit()
-            
+        self._start_save(close=True)
+    
+    def _start_save(self, close: bool) -> None:
+        """
+        Validate and write the config on the thread pool.
+        
+        The worker gets a deep copy, so edits made while it runs cannot race
+        with the write.
+        
+        Args:
+            close: Close the dialog once the save succeeds
+        """
+        job = _SaveJob(self.config_manager, copy.deepcopy(self.config), close)
+        job.signals.finished.connect(self._on_save_finished)
+        job.signals.failed.connect(self._on_save_failed)
+        self._save_jobs.add(job)
+        self._set_saving(True)
+        QThreadPool.globalInstance().start(job)
+    
+    def _on_save_finished(self, job: "_SaveJob") -> None:
+        """Report a completed save (GUI thread)."""
+        self._save_jobs.discard(job)
+        self._set_saving(bool(self._save_jobs))
+        self._clean_state = asdict(job.config)
+        
+        # Emit signal (coalesced: saves finishing in one tick notify once)
+        self._schedule_settings_changed(job.config)
+        
+        if job.close:
             logger.info("Settings saved successfully")
-            
             self.accept()
-            
-        except Exception as e:
-            logger.error(f"Failed to save settings: {e}")
-            QMessageBox.critical(
+        else:
+            logger.info("Settings applied successfully")
+            QMessageBox.information(
                 self,
-                "Error",
-                f"Failed to save settings:\n{e}"
+                "Settings Applied",
+                "Settings have been applied successfully."
             )
     
-    def _on_reset(self) -> None:
-        """Reset to default configuration."""
-        reply = QMessageBox.question(
+    def _schedule_settings_changed(self, config: LegionConfig) -> None:
+        """Emit settings_changed with the latest saved config on the next tick."""
+        if self._pending_config is None:
+            QTimer.singleShot(0, self._emit_settings_changed)
+        self._pending_config = config
+    
+    def _emit_settings_changed(self) -> None:
+        """Emit the pending settings_changed notification."""
+        config, self._pending_config = self._pending_config, None
+        self.settings_changed.emit(config)
+        self._delete_if_done()
+    
+    def _on_save_failed(self, job: "_SaveJob", error: str) -> None:
+        """Report a failed save (GUI thread)."""
+        self._save_jobs.discard(job)
+        self._set_saving(bool(self._save_jobs))
+        action = "save" if job.close else "apply"
+        logger.error("Failed to %s settings: %s", action, error)
+        QMessageBox.critical(
             self,
-            "Reset Settings",
-            "Reset all settings to defaults?\nThis cannot be undone.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            "Error",
+            f"Failed to {action} settings:\n{error}"
         )
+        self._delete_if_done()
+    
+    def done(self, result: int) -> None:
+        """Close the dialog and schedule its deletion."""
+        super().done(result)
+        self._closed = True
+        self._delete_if_done()
+    
+    def _delete_if_done(self) -> None:
+        """
+        Delete the closed dialog once no save or notification is in flight.
         
-        if reply == QMessageBox.StandardButton.Yes:
+        Like WA_DeleteOnClose, but a save still running (or its queued
+        settings_changed) keeps the dialog alive until it has been reported.
+        """
+        if self._closed and not self._save_jobs and self._pending_config is None:
+            self.deleteLater()
+    
+    def _set_saving(self, busy: bool) -> None:
+        """Disable Apply/Save/Reset while a save is running."""
+        for button in (self.apply_button, self.save_button, self.reset_button):
+            button.setEnabled(not busy)
+    
+    def _on_reset(self) -> None:
+        """Revert to the opened configuration or reset to defaults."""
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Question)
+        box.setWindowTitle("Reset Settings")
+        box.setText(
+            "Revert the changes made since this dialog was opened,\n"
+            "or reset all settings to defaults?"
+        )
+        revert_button = box.addButton("Revert Changes", QMessageBox.ButtonRole.ResetRole)
+        defaults_button = box.addButton("Restore Defaults", QMessageBox.ButtonRole.DestructiveRole)
+        box.addButton(QMessageBox.StandardButton.Cancel)
+        box.setDefaultButton(QMessageBox.StandardButton.Cancel)
+        box.exec()
+        
+        clicked = box.clickedButton()
+        if clicked is revert_button:
+            self.config = pickle.loads(self._original_blob)
+            self._load_values()
+            logger.info("Settings reverted to opened state")
+        elif clicked is defaults_button:
             self.config = LegionConfig()  # New default config
             self._load_values()
             logger.info("Settings reset to defaults")
+
+
+class _SaveSignals(QObject):
+    """Signals for _SaveJob (QRunnable is not a QObject)."""
+    
+    finished = pyqtSignal(object)  # _SaveJob
+    failed = pyqtSignal(object, str)  # _SaveJob, error message
+
+
+class _SaveJob(QRunnable):
+    """Validates and writes a config snapshot on the thread pool."""
+    
+    def __init__(self, config_manager: ConfigManager, config: LegionConfig, close: bool):
+        super().__init__()
+        self.config_manager = config_manager
+        self.config = config
+        self.close = close
+        self.signals = _SaveSignals()
+        # SettingsDialog keeps the Python reference until the result arrives
+        self.setAutoDelete(False)
+    
+    def run(self) -> None:
+        try:
+            # Validate
+            self.config.validate()
+            
+            # Save to file
+            self.config_manager.save(self.config)
+        except Exception as e:
+            self.signals.failed.emit(self, str(e))
+        else:
+            self.signals.finished.emit(self)
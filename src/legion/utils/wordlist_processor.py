@@ -8,12 +8,32 @@ Supports:
 - Automatic format detection
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Callable, Iterable, Iterator, List, Set, Tuple, Optional, Dict, Any, TypeVar, Union
 import logging
+import mmap
+import os
+import re
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on files read concurrently (keeps spinning disks from thrashing)
+_MAX_READERS = 8
+
+# Lines joined per write when dumping merged lists
+_WRITE_CHUNK = 65536
+
+T = TypeVar('T')
+StrPath = Union[str, Path]
+
+# Filename keywords used to categorize single-column lists
+# ('username' and 'password' are covered by 'user' and 'pass')
+_USERNAME_RE = re.compile(r'user|login|account|admin')
+_PASSWORD_RE = re.compile(r'pass|pwd|secret')
+
 
 class WordlistProcessor:
     """
@@ -26,7 +46,7 @@ class WordlistProcessor:
     """
     
     @staticmethod
-    def is_combo_file(file_path: Path) -> bool:
+    def is_combo_file(file_path: StrPath) -> bool:
         """
         Detect if file is combo format (username:password).
         
@@ -34,37 +54,32 @@ class WordlistProcessor:
             file_path: Path to wordlist file
             
         Returns:
-            True if file contains colon-separated credentials
+            True if >50% of the first 10 entries contain a colon
         """
-        if not file_path.exists():
-            return False
-        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                # Check first 10 non-empty lines
-                lines_checked = 0
-                colon_count = 0
-                
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    if ':' in line:
-                        colon_count += 1
-                    
-                    lines_checked += 1
-                    if lines_checked >= 10:
-                        break
-                
-                # If >50% have colons, it's a combo file
-                if lines_checked > 0:
-                    return (colon_count / lines_checked) > 0.5
-                    
-        except Exception as e:
+            head = list(islice(WordlistProcessor.iter_entries(file_path), 10))
+        except OSError as e:
             logger.warning(f"Error checking combo format for {file_path}: {e}")
+            return False
+        
+        return WordlistProcessor._is_combo_head(head)
+    
+    @staticmethod
+    def classify_filename(filename: str) -> Tuple[bool, bool]:
+        """
+        Categorize a wordlist by keywords in its filename.
         
-        return False
+        Args:
+            filename: File name (case-insensitive)
+            
+        Returns:
+            Tuple of (looks_like_username_list, looks_like_password_list)
+        """
+        filename_lower = filename.lower()
+        return (
+            _USERNAME_RE.search(filename_lower) is not None,
+            _PASSWORD_RE.search(filename_lower) is not None,
+        )
     
     @staticmethod
     def collect_wordlist_files(path: Path) -> List[Path]:
@@ -77,51 +92,332 @@ class WordlistProcessor:
         Returns:
             List of wordlist file paths
         """
+        return [Path(file) for file, _ in WordlistProcessor.collect_wordlist_paths(path)]
+    
+    @staticmethod
+    def collect_wordlist_paths(path: Path) -> List[Tuple[str, str]]:
+        """
+        Collect all wordlist files from path as plain strings.
+        
+        Used by the merge/analysis loops, which only need to open files
+        and look at their names; Path objects are built at the API edge.
+        
+        Args:
+            path: File or directory path
+            
+        Returns:
+            List of (file path, file name) tuples, sorted by path
+        """
         if path.is_file():
-            return [path]
+            return [(str(path), path.name)]
         
         if path.is_dir():
-            # Collect all .txt files
-            files = list(path.glob("*.txt"))
+            # Collect all .txt files (scandir answers is_file from the
+            # directory listing, except for symlinks, which are followed)
+            with os.scandir(path) as it:
+                files = sorted(
+                    ((entry.path, entry.name) for entry in it
+                     if entry.name.endswith('.txt') and entry.is_file()),
+                    key=lambda file: os.path.normcase(file[1])
+                )
             logger.info(f"Found {len(files)} wordlist files in {path}")
-            return sorted(files)
+            return files
         
         return []
     
     @staticmethod
-    def parse_combo_file(file_path: Path) -> Tuple[List[str], List[str]]:
+    def parse_combo_file(file_path: Path) -> Optional[Tuple[Set[str], Set[str]]]:
         """
-        Parse combo file (username:password) into separate lists.
+        Parse combo file (username:password) into separate sets.
+        
+        The format is checked on the first entries of the same read, so
+        callers don't need is_combo_file() beforehand.
         
         Args:
             file_path: Path to combo file
             
+        Returns:
+            Tuple of (usernames, passwords), unordered, or None if the file
+            is not in combo format (or cannot be read)
+        """
+        try:
+            lines = WordlistProcessor.iter_entries(file_path)
+            head = list(islice(lines, 10))
+            if not WordlistProcessor._is_combo_head(head):
+                return None
+            
+            return WordlistProcessor._split_combo(chain(head, lines))
+        
+        except Exception as e:
+            logger.error(f"Error parsing combo file {file_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _is_combo_head(head: Union[List[str], List[bytes]]) -> bool:
+        """Apply the combo rule (>50% contain a colon) to the first entries."""
+        if not head:
+            return False
+        colon = b':' if isinstance(head[0], bytes) else ':'
+        return sum(colon in line for line in head) / len(head) > 0.5
+    
+    @staticmethod
+    def _iter_lines_mmap(file_path: StrPath) -> Iterator[bytes]:
+        """Yield the raw lines of a file through a read-only memory map."""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # Empty files cannot be mapped
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                
+                pos = 0
+                end = len(mm)
+                while pos < end:
+                    nl = mm.find(b'\n', pos)
+                    if nl < 0:
+                        nl = end
+                    yield mm[pos:nl]
+                    pos = nl + 1
+    
+    @staticmethod
+    def iter_entries(file_path: StrPath) -> Iterator[str]:
+        """
+        Yield the entries of a wordlist file.
+        
+        Entries are stripped of ASCII whitespace; blank lines and '#'
+        comments are skipped. Only accepted lines are decoded (UTF-8,
+        invalid bytes dropped).
+        
+        Args:
+            file_path: Path to wordlist file
+            
+        Yields:
+            Wordlist entries in file order
+        """
+        for raw in WordlistProcessor._iter_lines_mmap(file_path):
+            raw = raw.strip()
+            if not raw or raw.startswith(b'#'):
+                continue
+            
+            # Already stripped and filtered as bytes; decoding can only
+            # come up empty when every byte was invalid
+            line = raw.decode('utf-8', 'ignore')
+            if line:
+                yield line
+    
+    @staticmethod
+    def scan_file(
+        file_path: StrPath,
+        combo_keep: int = 0,
+        list_keep: int = 0,
+        exact_limit: Optional[int] = None
+    ) -> Tuple[bool, int, List[str]]:
+        """
+        Detect a wordlist's format and count its entries in one pass.
+        
+        The first 10 entries decide the format (same rule as is_combo_file);
+        the rest of the file is counted in the same read. Lines are filtered
+        on the raw bytes and only the entries kept are decoded.
+        
+        Args:
+            file_path: Path to wordlist file
+            combo_keep: Unique entries to keep from a combo file
+            list_keep: Unique entries to keep from a single-column file
+            exact_limit: Once this many entries are counted (and the kept
+                entries are complete), stop reading and extrapolate the
+                total from the bytes consumed so far (None = count all)
+            
+        Returns:
+            Tuple of (is_combo, entry count, kept entries in file order);
+            combo files only count user:pass entries
+        """
+        consumed = 0
+        
+        def entries() -> Iterator[bytes]:
+            nonlocal consumed
+            for raw in WordlistProcessor._iter_lines_mmap(file_path):
+                consumed += len(raw) + 1
+                raw = raw.strip()
+                if raw and not raw.startswith(b'#'):
+                    yield raw
+        
+        lines = entries()
+        head = list(islice(lines, 10))
+        is_combo = WordlistProcessor._is_combo_head(head)
+        keep = combo_keep if is_combo else list_keep
+        
+        count = 0
+        kept: Dict[str, None] = {}
+        for raw in chain(head, lines):
+            if is_combo and b':' not in raw:
+                continue
+            
+            count += 1
+            if len(kept) < keep:
+                line = raw.decode('utf-8', 'ignore')
+                if line:
+                    kept[line] = None
+            elif exact_limit is not None and count > exact_limit:
+                # Past the point where precision matters - estimate the rest
+                count = count * os.path.getsize(file_path) // consumed
+                break
+        
+        return is_combo, count, list(kept)
+    
+    @staticmethod
+    def add_bounded(target: Union[Set[str], Dict[str, None]], entries: Iterable[str], limit: int) -> None:
+        """
+        Add entries to a set (or insertion-ordered dict) until it holds limit items.
+        
+        Entries are taken in islice batches sized to the remaining room, so
+        the set is filled at C level and the iterator is not read further
+        than needed.
+        
+        Args:
+            target: Set or dict to fill
+            entries: Entries in priority order
+            limit: Maximum size of target
+        """
+        it = iter(entries)
+        while len(target) < limit:
+            batch = list(islice(it, limit - len(target)))
+            if not batch:
+                break
+            if isinstance(target, dict):
+                target.update(dict.fromkeys(batch))
+            else:
+                target.update(batch)
+    
+    @staticmethod
+    def load_entries(file_path: StrPath, max_entries: Optional[int] = None) -> List[str]:
+        """
+        Load the unique entries of a single-column wordlist.
+        
+        Args:
+            file_path: Path to wordlist file
+            max_entries: Stop after this many unique entries (None = no limit)
+            
+        Returns:
+            Unique entries in file order (those read so far on errors)
+        """
+        entries: Dict[str, None] = {}
+        
+        try:
+            lines = WordlistProcessor.iter_entries(file_path)
+            if max_entries is None:
+                entries.update(dict.fromkeys(lines))
+            else:
+                WordlistProcessor.add_bounded(entries, lines, max_entries)
+        except Exception as e:
+            logger.error(f"Error reading {file_path}: {e}")
+        
+        return list(entries)
+    
+    @staticmethod
+    def write_entries(file_path: Path, entries: Iterable[str]) -> None:
+        """
+        Write entries sorted, one per line.
+        
+        Lines are joined and written in chunks, so the output never needs
+        a second full-size copy of the list in memory.
+        
+        Args:
+            file_path: Output file
+            entries: Entries to write
+        """
+        lines = sorted(entries)
+        with open(file_path, 'wb') as f:
+            # Binary mode: one encode per chunk, no text layer in between
+            for start in range(0, len(lines), _WRITE_CHUNK):
+                chunk = '\n'.join(lines[start:start + _WRITE_CHUNK])
+                f.write(chunk.encode('utf-8', 'replace') + b'\n')
+    
+    @staticmethod
+    def map_files(func: Callable[[StrPath], T], files: List[StrPath]) -> Iterator[T]:
+        """
+        Apply func to each file on a small thread pool.
+        
+        Reads overlap across files; results are still yielded in file order.
+        Files not yet started are cancelled when the caller stops early.
+        
+        Args:
+            func: Per-file loader
+            files: Files to load
+            
+        Yields:
+            func(file) for each file, in order
+        """
+        if len(files) <= 1:
+            yield from map(func, files)
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=min(_MAX_READERS, len(files)))
+        try:
+            yield from executor.map(func, files)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    @staticmethod
+    def _split_combo(entries: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+        """
+        Split combo entries into username and password sets.
+        
+        Args:
+            entries: Stripped combo file entries
+            
         Returns:
             Tuple of (usernames, passwords)
         """
-        usernames = set()
-        passwords = set()
+        # Collect into lists and hash once at the end (one bulk set build
+        # per list instead of a set.add call per entry)
+        usernames = []
+        passwords = []
+        
+        for line in entries:
+            user, sep, pwd = line.partition(':')
+            if sep:
+                usernames.append(user.strip())
+                passwords.append(pwd.strip())
+            else:
+                # No colon - treat as password
+                passwords.append(line)
+        
+        return set(usernames), set(passwords)
+    
+    @staticmethod
+    def _load_file(file_path: StrPath, max_entries: Optional[int] = None) -> Tuple[bool, List[str]]:
+        """
+        Read a wordlist once, detecting its format from the first entries.
         
+        Args:
+            file_path: Path to wordlist file
+            max_entries: Maximum entries kept from a single-column file
+                (combo files are always read in full)
+            
+        Returns:
+            Tuple of (is_combo, unique entries in file order)
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    if ':' in line:
-                        parts = line.split(':', 1)
-                        if len(parts) == 2:
-                            usernames.add(parts[0].strip())
-                            passwords.add(parts[1].strip())
-                    else:
-                        # No colon - treat as password
-                        passwords.add(line)
+            lines = WordlistProcessor.iter_entries(file_path)
+            
+            # Same rule as is_combo_file: >50% of the first 10 entries
+            head = list(islice(lines, 10))
+            is_combo = WordlistProcessor._is_combo_head(head)
+            entries = dict.fromkeys(head)
+            
+            if is_combo or max_entries is None:
+                entries.update(dict.fromkeys(lines))
+            else:
+                WordlistProcessor.add_bounded(entries, lines, max_entries)
         
         except Exception as e:
-            logger.error(f"Error parsing combo file {file_path}: {e}")
+            logger.error(f"Error reading {file_path}: {e}")
+            return False, []
         
-        return sorted(usernames), sorted(passwords)
+        if is_combo or max_entries is None:
+            return is_combo, list(entries)
+        return False, list(entries)[:max_entries]
     
     @staticmethod
     def merge_wordlists(
@@ -156,18 +452,22 @@ class WordlistProcessor:
         # If same path provided for both, use smart categorization
         if username_path and password_path and username_path == password_path:
             logger.info(f"Same path for both lists - using smart categorization")
-            files = WordlistProcessor.collect_wordlist_files(username_path)
+            files = WordlistProcessor.collect_wordlist_paths(username_path)
+            paths = [file for file, _ in files]
             
-            # Prioritize combo files for efficiency
-            combo_files = [f for f in files if WordlistProcessor.is_combo_file(f)]
-            non_combo_files = [f for f in files if not WordlistProcessor.is_combo_file(f)]
-            
-            # Process combo files first (most efficient)
-            for file in combo_files:
-                logger.info(f"Detected combo file: {file.name}")
-                users, pwds = WordlistProcessor.parse_combo_file(file)
-                usernames.update(users)
-                passwords.update(pwds)
+            # Each file is read once; combo files are applied as they come,
+            # single-column ones are held back (already capped at max_entries)
+            # so combos keep priority
+            non_combo_files = []
+            load = partial(WordlistProcessor._load_file, max_entries=max_entries)
+            for (_, name), (is_combo, entries) in zip(files, WordlistProcessor.map_files(load, paths)):
+                if is_combo:
+                    logger.info(f"Detected combo file: {name}")
+                    users, pwds = WordlistProcessor._split_combo(entries)
+                    usernames.update(users)
+                    passwords.update(pwds)
+                else:
+                    non_combo_files.append((name, entries))
                 
                 # Stop early if we have enough entries from combo files
                 if len(usernames) >= max_entries and len(passwords) >= max_entries:
@@ -176,38 +476,23 @@ class WordlistProcessor:
             
             # Only process non-combo files if we don't have enough entries
             if len(usernames) < max_entries or len(passwords) < max_entries:
-                for file in non_combo_files:
+                for name, lines in non_combo_files:
                     # Categorize by filename
-                    filename_lower = file.name.lower()
-                    
-                    # Check if file is clearly a username list
-                    is_username_file = any(keyword in filename_lower for keyword in [
-                        'user', 'username', 'login', 'account', 'admin'
-                    ])
+                    is_username_file, is_password_file = WordlistProcessor.classify_filename(name)
                     
-                    # Check if file is clearly a password list
-                    is_password_file = any(keyword in filename_lower for keyword in [
-                        'pass', 'password', 'pwd', 'secret'
-                    ])
-                    
-                    try:
-                        with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-                        
-                        if is_username_file and not is_password_file:
-                            logger.info(f"Categorized as username list: {file.name}")
-                            usernames.update(lines[:max_entries])  # Limit entries
-                        elif is_password_file and not is_username_file:
-                            logger.info(f"Categorized as password list: {file.name}")
-                            passwords.update(lines[:max_entries])  # Limit entries
-                        else:
-                            # Ambiguous - add to both for maximum coverage (but limited)
-                            logger.warning(f"Ambiguous file (adding to both lists): {file.name}")
-                            usernames.update(lines[:max_entries // 2])
-                            passwords.update(lines[:max_entries // 2])
-                    
-                    except Exception as e:
-                        logger.error(f"Error reading {file}: {e}")
+                    # Fill the destination sets directly, stopping at the limit
+                    if is_username_file and not is_password_file:
+                        logger.info(f"Categorized as username list: {name}")
+                        WordlistProcessor.add_bounded(usernames, lines, max_entries)
+                    elif is_password_file and not is_username_file:
+                        logger.info(f"Categorized as password list: {name}")
+                        WordlistProcessor.add_bounded(passwords, lines, max_entries)
+                    else:
+                        # Ambiguous - add to both for maximum coverage (but limited)
+                        logger.warning(f"Ambiguous file (adding to both lists): {name}")
+                        half = lines[:max_entries // 2]
+                        WordlistProcessor.add_bounded(usernames, half, max_entries)
+                        WordlistProcessor.add_bounded(passwords, half, max_entries)
                     
                     # Stop if we have enough entries
                     if len(usernames) >= max_entries and len(passwords) >= max_entries:
@@ -219,52 +504,38 @@ class WordlistProcessor:
             
             # Process username source
             if username_path:
-                files = WordlistProcessor.collect_wordlist_files(username_path)
+                files = WordlistProcessor.collect_wordlist_paths(username_path)
+                paths = [file for file, _ in files]
+                load = partial(WordlistProcessor._load_file, max_entries=max_entries)
                 
-                for file in files:
-                    if WordlistProcessor.is_combo_file(file):
-                        logger.info(f"Detected combo file: {file.name}")
-                        users, pwds = WordlistProcessor.parse_combo_file(file)
+                for (_, name), (is_combo, entries) in zip(files, WordlistProcessor.map_files(load, paths)):
+                    if is_combo:
+                        logger.info(f"Detected combo file: {name}")
+                        users, pwds = WordlistProcessor._split_combo(entries)
                         usernames.update(users)
                         passwords.update(pwds)
                     else:
                         # Single column - usernames
-                        try:
-                            with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                                for line in f:
-                                    line = line.strip()
-                                    if line and not line.startswith('#'):
-                                        usernames.add(line)
-                                        if len(usernames) >= max_entries:
-                                            break
-                        except Exception as e:
-                            logger.error(f"Error reading {file}: {e}")
+                        WordlistProcessor.add_bounded(usernames, entries, max_entries)
                     
                     if len(usernames) >= max_entries:
                         break
             
             # Process password source
             if password_path:
-                files = WordlistProcessor.collect_wordlist_files(password_path)
+                files = WordlistProcessor.collect_wordlist_paths(password_path)
+                paths = [file for file, _ in files]
+                load = partial(WordlistProcessor._load_file, max_entries=max_entries)
                 
-                for file in files:
-                    if WordlistProcessor.is_combo_file(file):
-                        logger.info(f"Detected combo file: {file.name}")
-                        users, pwds = WordlistProcessor.parse_combo_file(file)
+                for (_, name), (is_combo, entries) in zip(files, WordlistProcessor.map_files(load, paths)):
+                    if is_combo:
+                        logger.info(f"Detected combo file: {name}")
+                        users, pwds = WordlistProcessor._split_combo(entries)
                         usernames.update(users)
                         passwords.update(pwds)
                     else:
                         # Single column - passwords
-                        try:
-                            with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                                for line in f:
-                                    line = line.strip()
-                                    if line and not line.startswith('#'):
-                                        passwords.add(line)
-                                        if len(passwords) >= max_entries:
-                                            break
-                        except Exception as e:
-                            logger.error(f"Error reading {file}: {e}")
+                        WordlistProcessor.add_bounded(passwords, entries, max_entries)
                     
                     if len(passwords) >= max_entries:
                         break
@@ -273,13 +544,8 @@ class WordlistProcessor:
         username_file = temp_dir / "merged_usernames.txt"
         password_file = temp_dir / "merged_passwords.txt"
         
-        with open(username_file, 'w', encoding='utf-8') as f:
-            for user in sorted(usernames):
-                f.write(f"{user}\n")
-        
-        with open(password_file, 'w', encoding='utf-8') as f:
-            for pwd in sorted(passwords):
-                f.write(f"{pwd}\n")
+        WordlistProcessor.write_entries(username_file, usernames)
+        WordlistProcessor.write_entries(password_file, passwords)
         
         logger.info(
             f"Merged wordlists: {len(usernames)} usernames, {len(passwords)} passwords"
@@ -314,22 +580,20 @@ class WordlistProcessor:
         has_combo = False
         
         for file in files:
-            if WordlistProcessor.is_combo_file(file):
+            combo = WordlistProcessor.parse_combo_file(file)
+            if combo is not None:
                 has_combo = True
                 stats['is_combo'] = True
-                users, pwds = WordlistProcessor.parse_combo_file(file)
+                users, pwds = combo
                 all_entries.update(users)
                 all_entries.update(pwds)
                 stats['has_usernames'] = True
                 stats['has_passwords'] = True
             else:
                 try:
-                    with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                        for line in f:
-                            line = line.strip()
-                            if line and not line.startswith('#'):
-                                stats['total_lines'] += 1
-                                all_entries.add(line)
+                    for line in WordlistProcessor.iter_entries(file):
+                        stats['total_lines'] += 1
+                        all_entries.add(line)
                 except Exception:
                     pass
         
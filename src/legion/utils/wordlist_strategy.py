@@ -9,9 +9,10 @@ Date: 2025-11-13
 """
 
 import logging
+from functools import partial
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from legion.utils.wordlist_processor import WordlistProcessor
@@ -39,6 +40,13 @@ class WordlistAnalysis:
     total_password_entries: int
     estimated_combinations: int
     recommendation: str
+    # Unique entries read during analysis (file order, capped at the limits
+    # below) so the prepare_* helpers don't have to read the files again
+    combo_entries: List[str] = field(default_factory=list)
+    username_entries: List[str] = field(default_factory=list)
+    password_entries: List[str] = field(default_factory=list)
+    combo_entry_limit: int = 0
+    list_entry_limit: int = 0
 
 
 class WordlistStrategy:
@@ -55,13 +63,18 @@ class WordlistStrategy:
     """
     
     @staticmethod
-    def analyze_directory(path: Path, max_combo_entries: int = 10000) -> WordlistAnalysis:
+    def analyze_directory(
+        path: Path,
+        max_combo_entries: int = 10000,
+        max_list_entries: int = 1000
+    ) -> WordlistAnalysis:
         """
         Analyze wordlist directory and recommend attack strategy.
         
         Args:
             path: Directory containing wordlist files
             max_combo_entries: Maximum combo entries to use (prevents huge files)
+            max_list_entries: Maximum username/password entries kept for reuse
         
         Returns:
             WordlistAnalysis with categorized files and recommendations
@@ -69,8 +82,8 @@ class WordlistStrategy:
         if not path.exists():
             raise ValueError(f"Path does not exist: {path}")
         
-        # Collect all wordlist files
-        all_files = WordlistProcessor.collect_wordlist_files(path)
+        # Collect all wordlist files (plain strings; Paths only for the result)
+        all_files = WordlistProcessor.collect_wordlist_paths(path)
         
         combo_files = []
         username_files = []
@@ -81,48 +94,40 @@ class WordlistStrategy:
         total_username_entries = 0
         total_password_entries = 0
         
-        # Categorize each file
-        for file in all_files:
-            if WordlistProcessor.is_combo_file(file):
-                combo_files.append(file)
-                # Count entries
-                try:
-                    with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                        entries = sum(1 for line in f if line.strip() and ':' in line and not line.startswith('#'))
-                        total_combo_entries += entries
-                except Exception as e:
-                    logger.error(f"Error counting entries in {file}: {e}")
+        combo_entries: Dict[str, None] = {}
+        username_entries: Dict[str, None] = {}
+        password_entries: Dict[str, None] = {}
+        
+        # Categorize each file (reads overlap across files)
+        scan = partial(
+            WordlistStrategy._scan_file,
+            combo_limit=max_combo_entries,
+            list_limit=max_list_entries
+        )
+        scanned = WordlistProcessor.map_files(scan, [file for file, _ in all_files])
+        for (file, name), (is_combo, entries, kept) in zip(all_files, scanned):
+            if is_combo:
+                combo_files.append(Path(file))
+                if entries is not None:
+                    total_combo_entries += entries
+                    WordlistProcessor.add_bounded(combo_entries, kept, max_combo_entries)
             
-            else:
+            elif entries is not None:
                 # Categorize by filename
-                filename_lower = file.name.lower()
-                
-                is_username_file = any(keyword in filename_lower for keyword in [
-                    'user', 'username', 'login', 'account', 'admin'
-                ])
+                is_username_file, is_password_file = WordlistProcessor.classify_filename(name)
                 
-                is_password_file = any(keyword in filename_lower for keyword in [
-                    'pass', 'password', 'pwd', 'secret'
-                ])
-                
-                # Count entries
-                try:
-                    with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                        entries = sum(1 for line in f if line.strip() and not line.startswith('#'))
-                    
-                    if is_username_file and not is_password_file:
-                        username_files.append(file)
-                        total_username_entries += entries
-                    elif is_password_file and not is_username_file:
-                        password_files.append(file)
-                        total_password_entries += entries
-                    else:
-                        # Ambiguous - could be either
-                        ambiguous_files.append(file)
-                        logger.warning(f"Ambiguous file: {file.name}")
-                
-                except Exception as e:
-                    logger.error(f"Error reading {file}: {e}")
+                if is_username_file and not is_password_file:
+                    username_files.append(Path(file))
+                    total_username_entries += entries
+                    WordlistProcessor.add_bounded(username_entries, kept, max_list_entries)
+                elif is_password_file and not is_username_file:
+                    password_files.append(Path(file))
+                    total_password_entries += entries
+                    WordlistProcessor.add_bounded(password_entries, kept, max_list_entries)
+                else:
+                    # Ambiguous - could be either
+                    ambiguous_files.append(Path(file))
+                    logger.warning(f"Ambiguous file: {name}")
         
         # Determine optimal mode
         mode, recommendation = WordlistStrategy._determine_mode(
@@ -156,9 +161,46 @@ class WordlistStrategy:
             total_username_entries=total_username_entries,
             total_password_entries=total_password_entries,
             estimated_combinations=estimated_combinations,
-            recommendation=recommendation
+            recommendation=recommendation,
+            combo_entries=list(combo_entries),
+            username_entries=list(username_entries),
+            password_entries=list(password_entries),
+            combo_entry_limit=max_combo_entries,
+            list_entry_limit=max_list_entries
         )
     
+    @staticmethod
+    def _scan_file(
+        file: str,
+        combo_limit: int,
+        list_limit: int
+    ) -> Tuple[bool, Optional[int], List[str]]:
+        """
+        Categorize and count a file with a single read.
+        
+        Args:
+            file: Wordlist file
+            combo_limit: Unique entries to keep from a combo file
+            list_limit: Unique entries to keep from a single-column file
+        
+        Returns:
+            Tuple of (is_combo, entry count (estimated past the larger
+            limit) or None if the file could not be read, unique entries
+            kept in file order)
+        """
+        try:
+            # Counts beyond the larger cap only feed the estimate, so huge
+            # files are extrapolated instead of read to the end
+            return WordlistProcessor.scan_file(
+                file,
+                combo_keep=combo_limit,
+                list_keep=list_limit,
+                exact_limit=max(combo_limit, list_limit)
+            )
+        except Exception as e:
+            logger.error(f"Error reading {file}: {e}")
+            return False, None, []
+    
     @staticmethod
     def _determine_mode(
         combo_files: List[Path],
@@ -260,7 +302,8 @@ class WordlistStrategy:
     def prepare_combo_file(
         combo_files: List[Path],
         temp_dir: Path,
-        max_entries: int = 10000
+        max_entries: int = 10000,
+        analysis: Optional[WordlistAnalysis] = None
     ) -> Path:
         """
         Merge multiple combo files into single temp file for Hydra -C mode.
@@ -269,6 +312,8 @@ class WordlistStrategy:
             combo_files: List of combo files to merge
             temp_dir: Directory for temporary file
             max_entries: Maximum entries to include
+            analysis: Result of analyze_directory(); when it kept enough
+                entries they are used instead of re-reading combo_files
         
         Returns:
             Path to merged combo file
@@ -276,30 +321,26 @@ class WordlistStrategy:
         temp_dir.mkdir(parents=True, exist_ok=True)
         merged_file = temp_dir / "merged_combo.txt"
         
-        entries = set()
+        if analysis is not None and max_entries <= analysis.combo_entry_limit:
+            entries = set(analysis.combo_entries[:max_entries])
+            combo_files = []
+        else:
+            entries = set()
         
         for file in combo_files:
             try:
-                with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and ':' in line and not line.startswith('#'):
-                            entries.add(line)
-                            
-                            if len(entries) >= max_entries:
-                                logger.warning(f"Reached max combo entries ({max_entries}) - stopping")
-                                break
+                combos = (line for line in WordlistProcessor.iter_entries(file) if ':' in line)
+                WordlistProcessor.add_bounded(entries, combos, max_entries)
                 
                 if len(entries) >= max_entries:
+                    logger.warning(f"Reached max combo entries ({max_entries}) - stopping")
                     break
             
             except Exception as e:
                 logger.error(f"Error reading combo file {file}: {e}")
         
         # Write merged file
-        with open(merged_file, 'w', encoding='utf-8') as f:
-            for entry in sorted(entries):
-                f.write(f"{entry}\n")
+        WordlistProcessor.write_entries(merged_file, entries)
         
         logger.info(f"Created merged combo file: {len(entries)} entries → {merged_file}")
         
@@ -310,7 +351,8 @@ class WordlistStrategy:
         username_files: List[Path],
         password_files: List[Path],
         temp_dir: Path,
-        max_entries: int = 1000
+        max_entries: int = 1000,
+        analysis: Optional[WordlistAnalysis] = None
     ) -> Tuple[Path, Path]:
         """
         Merge username and password files into separate temp files for Hydra -L/-P mode.
@@ -320,6 +362,8 @@ class WordlistStrategy:
             password_files: List of password files
             temp_dir: Directory for temporary files
             max_entries: Maximum entries per file
+            analysis: Result of analyze_directory(); when it kept enough
+                entries they are used instead of re-reading the files
         
         Returns:
             Tuple of (username_file, password_file)
@@ -329,53 +373,30 @@ class WordlistStrategy:
         usernames = set()
         passwords = set()
         
+        if analysis is not None and max_entries <= analysis.list_entry_limit:
+            usernames.update(analysis.username_entries[:max_entries])
+            passwords.update(analysis.password_entries[:max_entries])
+            username_files = password_files = []
+        
         # Merge username files
-        for file in username_files:
-            try:
-                with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            usernames.add(line)
-                            
-                            if len(usernames) >= max_entries:
-                                break
-                
-                if len(usernames) >= max_entries:
-                    break
-            
-            except Exception as e:
-                logger.error(f"Error reading username file {file}: {e}")
+        load = partial(WordlistProcessor.load_entries, max_entries=max_entries)
+        for entries in WordlistProcessor.map_files(load, username_files):
+            WordlistProcessor.add_bounded(usernames, entries, max_entries)
+            if len(usernames) >= max_entries:
+                break
         
         # Merge password files
-        for file in password_files:
-            try:
-                with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            passwords.add(line)
-                            
-                            if len(passwords) >= max_entries:
-                                break
-                
-                if len(passwords) >= max_entries:
-                    break
-            
-            except Exception as e:
-                logger.error(f"Error reading password file {file}: {e}")
+        for entries in WordlistProcessor.map_files(load, password_files):
+            WordlistProcessor.add_bounded(passwords, entries, max_entries)
+            if len(passwords) >= max_entries:
+                break
         
         # Write files
         username_file = temp_dir / "merged_usernames.txt"
         password_file = temp_dir / "merged_passwords.txt"
         
-        with open(username_file, 'w', encoding='utf-8') as f:
-            for user in sorted(usernames):
-                f.write(f"{user}\n")
-        
-        with open(password_file, 'w', encoding='utf-8') as f:
-            for pwd in sorted(passwords):
-                f.write(f"{pwd}\n")
+        WordlistProcessor.write_entries(username_file, usernames)
+        WordlistProcessor.write_entries(password_file, passwords)
         
         logger.info(
             f"Created separate wordlists: {len(usernames)} users, {len(passwords)} passwords"
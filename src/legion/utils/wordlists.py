@@ -4,8 +4,54 @@ Wordlist utilities for Legion.
 Provides helper functions to locate and manage wordlists from scripts/wordlists/
 """
 
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Literal, Optional, List, Tuple
+import os
+
+from legion.utils.wordlist_processor import WordlistProcessor
+
+# Buffer/chunk size for wordlist reads (fewer, larger read syscalls)
+_READ_BUFFER_SIZE = 1 << 20
+
+# import_wordlist reads files below this size in a single call
+_SLURP_LIMIT = 100_000_000
+
+# get_wordlist_info reads files below this size in a single call
+_INFO_SLURP_LIMIT = 50_000_000
+
+# From src/legion/utils/wordlists.py -> scripts/wordlists/
+_WORDLISTS_DIR = Path(__file__).parent.parent.parent.parent / "scripts" / "wordlists"
+
+# Service-specific password lists
+_SERVICE_PASSWORD_FILES = {
+    'ssh': 'ssh-betterdefaultpasslist.txt',
+    'ftp': 'ftp-betterdefaultpasslist.txt',
+    'mysql': 'mysql-betterdefaultpasslist.txt',
+    'mssql': 'mssql-betterdefaultpasslist.txt',
+    'postgres': 'postgres-betterdefaultpasslist.txt',
+    'oracle': 'oracle-betterdefaultpasslist.txt',
+    'telnet': 'telnet-betterdefaultpasslist.txt',
+    'vnc': 'vnc-betterdefaultpasslist.txt',
+    'db2': 'db2-betterdefaultpasslist.txt',
+    'tomcat': 'tomcat-betterdefaultpasslist.txt',
+    'windows': 'windows-betterdefaultpasslist.txt',
+    'smb': 'windows-betterdefaultpasslist.txt',
+    'rdp': 'windows-betterdefaultpasslist.txt',
+}
+
+# Fallbacks, in order of preference
+_GENERIC_PASSWORD_FILES = (
+    'ssh-password.txt',
+    'ssh-betterdefaultpasslist.txt',
+    'root-userpass.txt'
+)
+_USERNAME_FILES = (
+    'ssh-user.txt',
+    'root-userpass.txt',
+    'routers-userpass.txt'
+)
 
 
 def get_wordlists_dir() -> Path:
@@ -15,9 +61,7 @@ def get_wordlists_dir() -> Path:
     Returns:
         Path to scripts/wordlists/ directory.
     """
-    # From src/legion/utils/wordlists.py -> scripts/wordlists/
-    base = Path(__file__).parent.parent.parent.parent / "scripts" / "wordlists"
-    return base
+    return _WORDLISTS_DIR
 
 
 def get_service_wordlists(service: str) -> tuple[Optional[Path], Optional[Path]]:
@@ -36,25 +80,8 @@ def get_service_wordlists(service: str) -> tuple[Optional[Path], Optional[Path]]
     if not wordlist_dir.exists():
         return None, None
     
-    # Service-specific password lists
-    service_password_files = {
-        'ssh': 'ssh-betterdefaultpasslist.txt',
-        'ftp': 'ftp-betterdefaultpasslist.txt',
-        'mysql': 'mysql-betterdefaultpasslist.txt',
-        'mssql': 'mssql-betterdefaultpasslist.txt',
-        'postgres': 'postgres-betterdefaultpasslist.txt',
-        'oracle': 'oracle-betterdefaultpasslist.txt',
-        'telnet': 'telnet-betterdefaultpasslist.txt',
-        'vnc': 'vnc-betterdefaultpasslist.txt',
-        'db2': 'db2-betterdefaultpasslist.txt',
-        'tomcat': 'tomcat-betterdefaultpasslist.txt',
-        'windows': 'windows-betterdefaultpasslist.txt',
-        'smb': 'windows-betterdefaultpasslist.txt',
-        'rdp': 'windows-betterdefaultpasslist.txt',
-    }
-    
     # Get service-specific password file
-    password_file = service_password_files.get(service.lower())
+    password_file = _SERVICE_PASSWORD_FILES.get(service.lower())
     password_path = None
     
     if password_file:
@@ -64,12 +91,7 @@ def get_service_wordlists(service: str) -> tuple[Optional[Path], Optional[Path]]
     
     # Fallback to generic password list
     if not password_path:
-        generic_passwords = [
-            'ssh-password.txt',
-            'ssh-betterdefaultpasslist.txt',
-            'root-userpass.txt'
-        ]
-        for filename in generic_passwords:
+        for filename in _GENERIC_PASSWORD_FILES:
             candidate = wordlist_dir / filename
             if candidate.exists():
                 password_path = candidate
@@ -77,13 +99,7 @@ def get_service_wordlists(service: str) -> tuple[Optional[Path], Optional[Path]]
     
     # Username wordlists
     username_path = None
-    username_candidates = [
-        'ssh-user.txt',
-        'root-userpass.txt',
-        'routers-userpass.txt'
-    ]
-    
-    for filename in username_candidates:
+    for filename in _USERNAME_FILES:
         candidate = wordlist_dir / filename
         if candidate.exists():
             username_path = candidate
@@ -96,21 +112,38 @@ def list_all_wordlists() -> List[Path]:
     """
     List all available wordlists.
     
+    The listing is cached until the directory's mtime changes (files
+    added, removed or renamed).
+    
     Returns:
         List of wordlist file paths.
     """
-    wordlist_dir = get_wordlists_dir()
-    
-    if not wordlist_dir.exists():
+    try:
+        mtime_ns = get_wordlists_dir().stat().st_mtime_ns
+    except OSError:
         return []
     
-    return sorted([f for f in wordlist_dir.glob("*.txt")])
+    return list(_list_wordlists_cached(mtime_ns))
+
+
+@lru_cache(maxsize=1)
+def _list_wordlists_cached(mtime_ns: int) -> Tuple[Path, ...]:
+    """List the wordlists directory (mtime_ns is the cache key only)."""
+    # scandir answers is_file from the directory listing (symlinks are
+    # still followed, so linked wordlists are included)
+    with os.scandir(get_wordlists_dir()) as it:
+        return tuple(sorted(
+            Path(entry.path) for entry in it
+            if entry.name.endswith('.txt') and entry.is_file()
+        ))
 
 
 def get_wordlist_info(wordlist_path: Path) -> dict:
     """
     Get information about a wordlist file.
     
+    Results are cached per file version (mtime and size).
+    
     Args:
         wordlist_path: Path to wordlist file.
     
@@ -121,25 +154,60 @@ def get_wordlist_info(wordlist_path: Path) -> dict:
         return {"error": "File not found"}
     
     try:
-        with open(wordlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
-        return {
-            "name": wordlist_path.name,
-            "path": str(wordlist_path),
-            "size_bytes": wordlist_path.stat().st_size,
-            "line_count": len(lines),
-            "first_lines": [line.strip() for line in lines[:5] if line.strip()]
-        }
+        st = wordlist_path.stat()
+        info = _wordlist_info_cached(str(wordlist_path), st.st_mtime_ns, st.st_size)
     except Exception as e:
         return {"error": str(e)}
+    
+    # Hand out a copy so callers can't modify the cached entry
+    return dict(info, first_lines=list(info["first_lines"]))
+
+
+@lru_cache(maxsize=256)
+def _wordlist_info_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Read wordlist info (mtime_ns and size are cache keys; errors aren't cached)."""
+    if size < _INFO_SLURP_LIMIT:
+        # Small files: one read, then count and split at C level
+        with open(path, 'rb') as f:
+            data = f.read()
+        head = data.split(b"\n", 5)[:5]
+        line_count = data.count(b"\n")
+        last = data[-1:] or b"\n"
+    else:
+        # Keep the preview lines, then count newlines in bulk binary reads
+        line_count = 0
+        last = b"\n"
+        with open(path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+            head = list(islice(f, 5))
+            for line in head:
+                line_count += line.count(b"\n")
+                last = line[-1:]
+            
+            while chunk := f.read(_READ_BUFFER_SIZE):
+                line_count += chunk.count(b"\n")
+                last = chunk[-1:]
+    
+    if last != b"\n":
+        line_count += 1  # Last line has no trailing newline
+    
+    first_lines = (line.decode('utf-8', errors='ignore').strip() for line in head)
+    
+    return {
+        "name": Path(path).name,
+        "path": path,
+        "size_bytes": size,
+        "line_count": line_count,
+        "first_lines": [line for line in first_lines if line]
+    }
 
 
 def export_credentials_to_wordlist(
     credentials: List,
     output_file: Path,
     mode: str = "passwords",
-    append: bool = False
+    append: bool = False,
+    dedup: bool = True,
+    order: Literal["sorted", "insertion", "unordered"] = "sorted"
 ) -> int:
     """
     Export credentials to a wordlist file.
@@ -149,37 +217,47 @@ def export_credentials_to_wordlist(
         output_file: Output file path.
         mode: Export mode - "passwords", "usernames", or "combo" (user:pass).
         append: If True, append to existing file and avoid duplicates.
+        dedup: If False, append without reading the existing file
+            (faster for large files, but entries may repeat).
+        order: "sorted" (default), "insertion" (credential order) or
+            "unordered" (whatever is cheapest; currently insertion order).
     
     Returns:
         Number of NEW lines written.
     """
-    lines = set()  # Use set to avoid duplicates within new credentials
-    
-    for cred in credentials:
-        if mode == "passwords":
-            lines.add(cred.password)
-        elif mode == "usernames":
-            lines.add(cred.username)
-        elif mode == "combo":
-            lines.add(f"{cred.username}:{cred.password}")
-    
-    # If appending, read existing lines to avoid duplicates
-    existing_lines = set()
-    if append and output_file.exists():
+    # Ordered dict keys avoid duplicates within new credentials while
+    # keeping insertion order available
+    if mode == "passwords":
+        lines = dict.fromkeys(cred.password for cred in credentials)
+    elif mode == "usernames":
+        lines = dict.fromkeys(cred.username for cred in credentials)
+    elif mode == "combo":
+        lines = dict.fromkeys(f"{cred.username}:{cred.password}" for cred in credentials)
+    else:
+        lines = {}
+    
+    # If appending, stream the existing file and drop lines it already has;
+    # only the (small) new set is held in memory, never the existing file
+    lines_to_write = lines
+    if append and dedup and output_file.exists():
         try:
             with open(output_file, 'r', encoding='utf-8') as f:
-                existing_lines = {line.strip() for line in f if line.strip()}
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        lines_to_write.pop(line, None)
+                        if not lines_to_write:
+                            break
         except Exception:
-            pass  # If read fails, just overwrite
-    
-    # Filter out duplicates
-    lines_to_write = lines - existing_lines
+            pass  # If read fails, just append everything not yet matched
     
-    # Write to file
+    # Write to file (one joined write instead of one per line)
     write_mode = 'a' if append else 'w'
     with open(output_file, write_mode, encoding='utf-8') as f:
-        for line in sorted(lines_to_write):
-            f.write(f"{line}\n")
+        if lines_to_write:
+            if order == "sorted":
+                lines_to_write = sorted(lines_to_write)
+            f.write("\n".join(lines_to_write) + "\n")
     
     return len(lines_to_write)
 
@@ -198,35 +276,75 @@ def import_wordlist(
     Returns:
         List of tuples: [(username, password), ...] or [(None, password), ...]
     """
+    return list(iter_wordlist(wordlist_path, format))
+
+
+def iter_wordlist(
+    wordlist_path: Path,
+    format: str = "auto"
+) -> Iterator[tuple]:
+    """
+    Parse a wordlist lazily, one entry at a time.
+    
+    Same parsing as import_wordlist(), without building the whole list;
+    use it when entries are consumed one by one.
+    
+    Args:
+        wordlist_path: Path to wordlist file.
+        format: Format - "auto", "passwords", "usernames", "combo" (user:pass).
+    
+    Returns:
+        Iterator of (username, password) tuples.
+    
+    Raises:
+        FileNotFoundError: If the wordlist does not exist (raised on call,
+            not on first iteration).
+    """
     if not wordlist_path.exists():
         raise FileNotFoundError(f"Wordlist not found: {wordlist_path}")
     
-    entries = []
-    
-    with open(wordlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            # Auto-detect format
-            if format == "auto" or format == "combo":
-                if ':' in line:
-                    parts = line.split(':', 1)
-                    username = parts[0].strip()
-                    password = parts[1].strip() if len(parts) > 1 else ""
-                    entries.append((username, password))
-                else:
-                    # Just password
-                    entries.append((None, line))
-            elif format == "passwords":
-                entries.append((None, line))
-            elif format == "usernames":
-                entries.append((line, None))
-    
-    return entries
+    return _iter_wordlist_entries(wordlist_path, format)
 
 
+def _iter_wordlist_entries(wordlist_path: Path, format: str) -> Iterator[tuple]:
+    """Generator behind iter_wordlist()."""
+    if wordlist_path.stat().st_size < _SLURP_LIMIT:
+        # Files that comfortably fit in memory are read in one call and
+        # split at C level
+        with open(wordlist_path, 'r', encoding='utf-8', errors='ignore',
+                  buffering=_READ_BUFFER_SIZE) as f:
+            lines = f.read().split('\n')
+    else:
+        # Huge dumps are memory-mapped and demand-paged; only the lines
+        # kept (already stripped, comments dropped) are decoded
+        lines = WordlistProcessor.iter_entries(wordlist_path)
+    
+    # Resolve the format once instead of per line
+    combo = format == "auto" or format == "combo"
+    strip = str.strip
+    partition = str.partition
+    
+    for line in lines:
+        line = strip(line)
+        first = line[:1]
+        if not first or first == '#':
+            continue
+        
+        # Auto-detect format
+        if combo:
+            if ':' in line:
+                # The line is already stripped, so only the sides next to
+                # the colon can carry whitespace
+                username, _, password = partition(line, ':')
+                yield (username.rstrip(), password.lstrip())
+            else:
+                # Just password
+                yield (None, line)
+        elif format == "passwords":
+            yield (None, line)
+        elif format == "usernames":
+            yield (line, None)
+
 if __name__ == "__main__":
     # Demo
     print("=== Wordlist Utilities Demo ===\n")
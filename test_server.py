@@ -8,8 +8,9 @@ Usage:
     python test_server.py
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import base64
+import hmac
 
 
 class AuthHandler(BaseHTTPRequestHandler):
@@ -17,31 +18,10 @@ class AuthHandler(BaseHTTPRequestHandler):
     
     # Valid credentials (Base64 encoded: admin:123456!)
     VALID_AUTH = base64.b64encode(b'admin:123456!').decode('ascii')
+    _VALID_AUTH_BYTES = VALID_AUTH.encode('ascii')
     
-    def do_GET(self):
-        """Handle GET requests with authentication."""
-        # Get Authorization header
-        auth_header = self.headers.get('Authorization')
-        
-        # Check authentication for ALL paths
-        if not auth_header or not auth_header.startswith('Basic '):
-            self.send_auth_required()
-            return
-        
-        # Extract credentials
-        auth_decoded = auth_header[6:]  # Remove "Basic " prefix
-        
-        # Validate credentials
-        if auth_decoded != self.VALID_AUTH:
-            self.send_auth_required()
-            return
-        
-        # Authentication successful
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        
-        html = """
+    # Response bodies are built once; only the path is encoded per request
+    _OK_PREFIX = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -91,30 +71,13 @@ class AuthHandler(BaseHTTPRequestHandler):
                     <li>Username: <code>admin</code></li>
                     <li>Password: <code>123456!</code></li>
                 </ul>
-                <p><strong>Path:</strong> {path}</p>
+                <p><strong>Path:</strong> """.encode('utf-8')
+    _OK_SUFFIX = """</p>
             </div>
         </body>
         </html>
-        """.format(path=self.path)
-        
-        self.wfile.write(html.encode('utf-8'))
-    
-    def do_HEAD(self):
-        """Handle HEAD requests."""
-        self.do_GET()
-    
-    def do_POST(self):
-        """Handle POST requests."""
-        self.do_GET()
-    
-    def send_auth_required(self):
-        """Send 401 Unauthorized response."""
-        self.send_response(401)
-        self.send_header('WWW-Authenticate', 'Basic realm="Test Server"')
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        
-        html = """
+        """.encode('utf-8')
+    _401_BODY = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -143,9 +106,51 @@ class AuthHandler(BaseHTTPRequestHandler):
             </div>
         </body>
         </html>
-        """
+        """.encode('utf-8')
+    
+    def do_GET(self):
+        """Handle GET requests with authentication."""
+        # Get Authorization header
+        auth_header = self.headers.get('Authorization')
+        
+        # Check authentication for ALL paths
+        if not auth_header or not auth_header.startswith('Basic '):
+            self.send_auth_required()
+            return
+        
+        # Extract credentials (headers arrive latin-1 decoded)
+        token = auth_header[6:].encode('latin-1')  # Remove "Basic " prefix
+        
+        # Validate credentials in constant time
+        if not hmac.compare_digest(token, self._VALID_AUTH_BYTES):
+            self.send_auth_required()
+            return
+        
+        # Authentication successful
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html')
+        self.end_headers()
+        
+        self.wfile.write(
+            self._OK_PREFIX + self.path.encode('utf-8', 'replace') + self._OK_SUFFIX
+        )
+    
+    def do_HEAD(self):
+        """Handle HEAD requests."""
+        self.do_GET()
+    
+    def do_POST(self):
+        """Handle POST requests."""
+        self.do_GET()
+    
+    def send_auth_required(self):
+        """Send 401 Unauthorized response."""
+        self.send_response(401)
+        self.send_header('WWW-Authenticate', 'Basic realm="Test Server"')
+        self.send_header('Content-type', 'text/html')
+        self.end_headers()
         
-        self.wfile.write(html.encode('utf-8'))
+        self.wfile.write(self._401_BODY)
     
     def log_message(self, format, *args):
         """Custom log format."""
@@ -168,7 +173,9 @@ def run_server(port=8080):
         port: Port number (default: 8080)
     """
     server_address = ('', port)
-    httpd = HTTPServer(server_address, AuthHandler)
+    # One thread per connection so parallel brute-force attempts don't queue
+    httpd = ThreadingHTTPServer(server_address, AuthHandler)
+    httpd.daemon_threads = True
     
     print("=" * 70)
     print("🌐 HTTP Basic Auth Test Server")